@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+🔥 HANDY REAPER - Benchmark Harness 🔥
+Drives the scanners against a local stub platform farm and stub DNS resolver
+so throughput can be measured without touching real sites.
+Cyberzilla™ - MMXXVI
+"""
+
+import asyncio
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import resource
+import socket
+import sys
+import time
+from typing import Dict, List, Any
+
+import dns.message
+import dns.rdatatype
+import dns.rrset
+from aiohttp import web
+
+from main import (
+    Colors,
+    EnhancedOSINTSystem,
+    DNSAnalyzer,
+    DNSCache,
+    RateLimiter,
+)
+
+# The farm binds one loopback address per platform (127.0.0.2, 127.0.0.3, ...)
+# so per-host limits behave as they would against real sites. Linux routes the
+# whole 127.0.0.0/8 block to loopback; elsewhere use --single-host.
+FARM_PORT = 18080
+DNS_PORT = 15353
+
+
+class LatencyModel:
+    """Samples response delays from 'fixed:MS', 'uniform:LO:HI' or 'lognormal:MEDIAN:SIGMA'."""
+
+    def __init__(self, spec: str):
+        kind, *params = spec.split(':')
+        self.kind = kind
+        self.params = [float(p) for p in params]
+        if kind not in ('fixed', 'uniform', 'lognormal'):
+            raise ValueError(f"unknown latency model: {spec}")
+
+    def sample(self) -> float:
+        if self.kind == 'fixed':
+            return self.params[0] / 1000
+        if self.kind == 'uniform':
+            return random.uniform(self.params[0], self.params[1]) / 1000
+        median, sigma = self.params
+        return random.lognormvariate(math.log(median), sigma) / 1000
+
+
+class PlatformFarm:
+    """aiohttp app imitating every platform with configurable failure modes.
+
+    Outcomes are picked deterministically per (platform, username) so repeated
+    runs see the same mix of found, missing, redirected and hanging targets.
+    Throttling is rolled per request, the way a real rate limit behaves.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        self.latency = LatencyModel(args.latency)
+        self.not_found_rate = args.not_found_rate
+        self.throttle_rate = args.throttle_rate
+        self.redirect_rate = args.redirect_rate
+        self.timeout_rate = args.timeout_rate
+        self.hang_seconds = args.hang_seconds
+        self.body = b'<html>' + b'x' * (args.body_kb * 1024) + b'</html>'
+        self.requests = 0
+
+    def outcome(self, platform: str, username: str) -> str:
+        roll = random.Random(f"{platform}:{username}").random()
+        for name, rate in (
+            ('timeout', self.timeout_rate),
+            ('redirect', self.redirect_rate),
+            ('not_found', self.not_found_rate),
+        ):
+            if roll < rate:
+                return name
+            roll -= rate
+        return 'found'
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        self.requests += 1
+        platform = request.match_info['platform']
+        username = request.match_info['username']
+        await asyncio.sleep(self.latency.sample())
+
+        if random.random() < self.throttle_rate:
+            return web.Response(status=429, headers={'Retry-After': '1'})
+
+        outcome = self.outcome(platform, username)
+        if outcome == 'timeout':
+            await asyncio.sleep(self.hang_seconds)
+            return web.Response(status=504)
+        if outcome == 'redirect':
+            raise web.HTTPFound(f"/{platform}/login/search?q={username}")
+        if outcome == 'not_found':
+            return web.Response(status=404, text='not found')
+
+        if request.method == 'HEAD':
+            return web.Response(status=200, headers={'Content-Length': str(len(self.body))})
+        return web.Response(status=200, body=self.body, content_type='text/html')
+
+    async def login(self, request: web.Request) -> web.Response:
+        return web.Response(status=200, text='login')
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route('*', '/{platform}/login/search', self.login)
+        app.router.add_route('*', '/{platform}/{username}', self.handle)
+        return app
+
+
+class StubResolver(asyncio.DatagramProtocol):
+    """UDP DNS server answering every query with canned records after a delay."""
+
+    RECORDS = {
+        'A': ['192.0.2.10'],
+        'AAAA': ['2001:db8::10'],
+        'MX': ['10 mail.{}'],
+        'TXT': ['"v=spf1 include:_spf.example.net -all"'],
+        'NS': ['ns1.{}', 'ns2.{}'],
+    }
+    DMARC = ['"v=DMARC1; p=none"']
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.transport = None
+        self.queries = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.queries += 1
+        query = dns.message.from_wire(data)
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        rdtype = dns.rdatatype.to_text(question.rdtype)
+        name = question.name.to_text()
+        records = self.RECORDS.get(rdtype)
+        if name.startswith('_dmarc.'):
+            records = self.DMARC if rdtype == 'TXT' else None
+        if records:
+            response.answer.append(dns.rrset.from_text_list(
+                question.name, 300, 'IN', rdtype, [record.format(name) for record in records]
+            ))
+        asyncio.get_running_loop().call_later(
+            self.latency.sample(), self.transport.sendto, response.to_wire(), addr
+        )
+
+
+class TimedOSINTSystem(EnhancedOSINTSystem):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies: List[float] = []
+
+    async def check_platform(self, platform: str, url: str, username: str, attempt: int = 0) -> Any:
+        started = time.perf_counter()
+        try:
+            return await super().check_platform(platform, url, username, attempt)
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+
+
+class TimedDNSAnalyzer(DNSAnalyzer):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies: List[float] = []
+
+    async def analyze_domain(self, domain: str) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            return await super().analyze_domain(domain)
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def measurement(count: int, elapsed: float, cpu: float, latencies: List[float]) -> Dict[str, Any]:
+    return {
+        'operations': count,
+        'elapsed_seconds': elapsed,
+        'operations_per_second': count / elapsed if elapsed > 0 else 0.0,
+        'latency_ms': {
+            'p50': percentile(latencies, 50) * 1000,
+            'p95': percentile(latencies, 95) * 1000,
+            'p99': percentile(latencies, 99) * 1000,
+        },
+        'cpu_seconds': cpu,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def build_system(args: argparse.Namespace) -> TimedOSINTSystem:
+    system = TimedOSINTSystem(
+        max_concurrency=args.concurrency,
+        per_host_limit=args.per_host,
+        rate_limiter=RateLimiter(max_requests=10 ** 6, time_window=1)
+    )
+    system.platforms = {
+        platform: f"http://{farm_host(args, index)}:{FARM_PORT}/{platform}/{{}}"
+        for index, platform in enumerate(system.platforms)
+    }
+    return system
+
+
+def farm_host(args: argparse.Namespace, index: int) -> str:
+    return '127.0.0.1' if args.single_host else f"127.0.0.{index + 2}"
+
+
+async def bench_muscle(args: argparse.Namespace) -> Dict[str, Any]:
+    system = build_system(args)
+    await system.initialize()
+    started, cpu_started = time.perf_counter(), time.process_time()
+    try:
+        for round_index in range(args.rounds):
+            await system.muscle_scan(f"target{round_index}")
+    finally:
+        await system.close()
+    return measurement(
+        len(system.latencies),
+        time.perf_counter() - started,
+        time.process_time() - cpu_started,
+        system.latencies
+    )
+
+
+async def bench_bulk(args: argparse.Namespace) -> Dict[str, Any]:
+    system = build_system(args)
+    usernames = (f"user{index}" for index in range(args.targets))
+    started, cpu_started = time.perf_counter(), time.process_time()
+    try:
+        await system.bulk_scan(usernames)
+    finally:
+        await system.close()
+    return measurement(
+        len(system.latencies),
+        time.perf_counter() - started,
+        time.process_time() - cpu_started,
+        system.latencies
+    )
+
+
+async def bench_dns(args: argparse.Namespace) -> Dict[str, Any]:
+    analyzer = TimedDNSAnalyzer(cache=DNSCache())
+    analyzer.resolver.nameservers = ['127.0.0.1']
+    analyzer.resolver.port = DNS_PORT
+    domains = (f"domain{index}.test" for index in range(args.domains))
+    started, cpu_started = time.perf_counter(), time.process_time()
+    async for _ in analyzer.analyze_domains(domains, args.dns_concurrency):
+        pass
+    return measurement(
+        len(analyzer.latencies),
+        time.perf_counter() - started,
+        time.process_time() - cpu_started,
+        analyzer.latencies
+    )
+
+
+SCENARIOS = {
+    'muscle': bench_muscle,
+    'bulk': bench_bulk,
+    'dns': bench_dns,
+}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    regressions = []
+    for scenario, current in results.items():
+        previous = baseline.get(scenario)
+        if not previous:
+            continue
+        if current['operations_per_second'] < previous['operations_per_second'] * (1 - tolerance):
+            regressions.append(
+                f"{scenario}: throughput {current['operations_per_second']:.1f}/s "
+                f"vs baseline {previous['operations_per_second']:.1f}/s"
+            )
+        if current['latency_ms']['p95'] > previous['latency_ms']['p95'] * (1 + tolerance):
+            regressions.append(
+                f"{scenario}: p95 {current['latency_ms']['p95']:.1f}ms "
+                f"vs baseline {previous['latency_ms']['p95']:.1f}ms"
+            )
+    return regressions
+
+
+def print_results(results: Dict[str, Any]):
+    print(f"\n{Colors.BOLD}{Colors.PINK}🔥 HANDY REAPER - BENCHMARK{Colors.END}")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+    for scenario, result in results.items():
+        latency = result['latency_ms']
+        print(f"{Colors.BOLD}{scenario}:{Colors.END}")
+        print(f"  Operations: {result['operations']} in {result['elapsed_seconds']:.2f}s "
+              f"({Colors.CYAN}{result['operations_per_second']:.1f}/s{Colors.END})")
+        print(f"  Latency p50/p95/p99: {latency['p50']:.1f} / {latency['p95']:.1f} / {latency['p99']:.1f} ms")
+        print(f"  CPU: {result['cpu_seconds']:.2f}s  Peak RSS: {result['peak_rss_mb']:.1f} MB")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="🔥 HANDY REAPER - Benchmark harness")
+    parser.add_argument("--scenario", choices=[*SCENARIOS, 'all'], default='all', help="What to benchmark")
+    parser.add_argument("--rounds", type=int, default=5, help="Usernames scanned one at a time in the muscle scenario")
+    parser.add_argument("--targets", type=int, default=200, help="Usernames in the bulk scenario")
+    parser.add_argument("--domains", type=int, default=1000, help="Domains in the DNS scenario")
+    parser.add_argument("--concurrency", type=int, default=50, help="Maximum requests in flight")
+    parser.add_argument("--per-host", type=int, default=4, help="Maximum requests in flight per host")
+    parser.add_argument("--dns-concurrency", type=int, default=32, help="Maximum domains analyzed at once")
+    parser.add_argument("--latency", default="lognormal:40:0.5", help="fixed:MS, uniform:LO:HI or lognormal:MEDIAN:SIGMA")
+    parser.add_argument("--dns-latency", default="uniform:1:10", help="Latency model for the stub resolver")
+    parser.add_argument("--not-found-rate", type=float, default=0.5, help="Share of targets answering 404")
+    parser.add_argument("--throttle-rate", type=float, default=0.02, help="Share of targets answering 429")
+    parser.add_argument("--redirect-rate", type=float, default=0.05, help="Share of targets redirecting")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Share of targets that hang")
+    parser.add_argument("--hang-seconds", type=float, default=15.0, help="How long hanging targets stall")
+    parser.add_argument("--body-kb", type=int, default=256, help="Size of found-profile bodies")
+    parser.add_argument("--single-host", action="store_true", help="Serve every platform from 127.0.0.1")
+    parser.add_argument("--baseline", default="bench_baseline.json", help="Baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed regression before failing")
+    parser.add_argument("--output", help="Also write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.ERROR)
+
+    runner = web.AppRunner(PlatformFarm(args).app(), access_log=None)
+    await runner.setup()
+    hosts = 1 if args.single_host else len(EnhancedOSINTSystem().platforms)
+    for index in range(hosts):
+        await web.TCPSite(runner, farm_host(args, index), FARM_PORT).start()
+
+    # A query burst can overflow the default UDP receive buffer, which would
+    # show up as resolver timeouts rather than resolver cost.
+    dns_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    dns_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    dns_socket.bind(('127.0.0.1', DNS_PORT))
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: StubResolver(LatencyModel(args.dns_latency)),
+        sock=dns_socket
+    )
+
+    scenarios = list(SCENARIOS) if args.scenario == 'all' else [args.scenario]
+    results = {}
+    try:
+        for scenario in scenarios:
+            results[scenario] = await SCENARIOS[scenario](args)
+    finally:
+        transport.close()
+        await runner.cleanup()
+
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"{Colors.GREEN}📄 Baseline saved to: {args.baseline}{Colors.END}")
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"{Colors.RED}❌ Regressions against {args.baseline}:{Colors.END}")
+            for regression in regressions:
+                print(f"  • {regression}")
+            return 1
+        print(f"{Colors.GREEN}✓ No regressions against {args.baseline}{Colors.END}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
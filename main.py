@@ -7,20 +7,42 @@ Cyberzilla™ - MMXXVI
 
 import asyncio
 import aiohttp
+import atexit
 import json
 import random
+import re
 import time
 import os
 import argparse
+import heapq
+import bisect
+import itertools
+import gzip
 import socket
-import dns.resolver
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
-from dataclasses import dataclass, asdict
+import sqlite3
+import sys
+import queue
+import threading
+import multiprocessing
+import zlib
+import uuid
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Any, Optional, Union, Callable, Awaitable, Iterable, Iterator, AsyncIterable, AsyncIterator, Tuple, Set, TYPE_CHECKING
+from collections import defaultdict, deque, OrderedDict
+from dataclasses import dataclass, asdict, replace
+from functools import partial
+from urllib.parse import urlparse, urljoin
 import logging
+import logging.handlers
 from pathlib import Path
 
+if TYPE_CHECKING:
+    # Optional subsystems are imported where they are used so that a plain
+    # username scan does not pay for dnspython or the aiohttp server at startup
+    import dns.asyncresolver
+    from aiohttp import web
+
 # Color codes for terminal output
 class Colors:
     PINK = '\033[95m'
@@ -50,25 +72,78 @@ def display_banner():
 """
     print(banner)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('osint_reaper.log'),
-        logging.StreamHandler()
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+class BackgroundLogHandler(logging.handlers.QueueHandler):
+    """Queue records as-is; the listener thread does all message and line formatting."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() formats and copies every record on the caller;
+        # the queue never leaves this process, so the listener can do it
+        return record
+
+def configure_logging(level: str = 'INFO', log_file: Optional[str] = 'osint_reaper.log') -> Optional[logging.handlers.QueueListener]:
+    """Send log records through a queue to a background thread that does the console and file writes.
+    
+    The event loop only pays for building the record; ``level='OFF'`` disables
+    logging outright so filtered calls return before any formatting happens.
+    """
+    root = logging.getLogger()
+    if level.upper() == 'OFF':
+        logging.disable(logging.CRITICAL)
+        return None
+    
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, *handlers)
+    root.handlers[:] = [BackgroundLogHandler(records)]
+    root.setLevel(level.upper())
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 @dataclass
 class RateLimitConfig:
     max_requests: int = 10
-    time_window: int = 60
-    requests: List[float] = None
+    time_window: float = 60
+    burst: Optional[int] = None
     
     def __post_init__(self):
-        if self.requests is None:
-            self.requests = []
+        if self.burst is None:
+            self.burst = self.max_requests
+        if self.max_requests <= 0 or self.time_window <= 0:
+            raise ValueError(f"requests and window must be positive, got {self.max_requests}/{self.time_window:g}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+    
+    @property
+    def interval(self) -> float:
+        return self.time_window / self.max_requests
+    
+    @classmethod
+    def parse(cls, spec: str) -> 'RateLimitConfig':
+        """Parse 'REQUESTS/SECONDS[:BURST]', e.g. '10/60' or '30/60:5'."""
+        rate, _, burst = spec.partition(':')
+        max_requests, _, time_window = rate.partition('/')
+        return cls(
+            max_requests=int(max_requests),
+            time_window=float(time_window or 1),
+            burst=int(burst) if burst else None
+        )
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RateLimitConfig':
+        return cls(
+            max_requests=int(data.get('max_requests', 10)),
+            time_window=float(data.get('time_window', 60)),
+            burst=data.get('burst')
+        )
 
 @dataclass
 class ProxyConfig:
@@ -83,33 +158,990 @@ class ProxyConfig:
             self.proxy_list = []
 
 class RateLimiter:
-    def __init__(self, max_requests: int = 10, time_window: int = 60):
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.requests = defaultdict(list)
-        
-    async def acquire(self, key: str = "default") -> bool:
-        current_time = time.time()
-        self.requests[key] = [
-            req_time for req_time in self.requests[key]
-            if current_time - req_time < self.time_window
+    """GCRA token bucket keyed by host (or host and proxy).
+
+    Each acquire reserves the next free slot in constant time, so waiters are
+    released in arrival order instead of waking together and retrying. Keys
+    whose bucket has fully refilled are swept periodically to keep memory flat.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 10,
+        time_window: float = 60,
+        burst: Optional[int] = None,
+        platform_limits: Optional[Dict[str, RateLimitConfig]] = None
+    ):
+        self.default_limit = RateLimitConfig(max_requests, time_window, burst)
+        self.platform_limits = platform_limits or {}
+        self.arrivals: Dict[str, float] = {}
+        self.sweep_interval = 60.0
+        self.last_sweep = time.monotonic()
+    
+    def limit_for(self, platform: Optional[str] = None) -> RateLimitConfig:
+        return self.platform_limits.get(platform, self.default_limit)
+    
+    def _sweep(self, now: float):
+        if now - self.last_sweep < self.sweep_interval:
+            return
+        self.last_sweep = now
+        self.arrivals = {key: tat for key, tat in self.arrivals.items() if tat > now}
+        
+    def _reserve(self, key: str, limit: RateLimitConfig, now: float, only_if_free: bool = False) -> float:
+        self._sweep(now)
+        arrival = max(self.arrivals.get(key, now), now)
+        wait = arrival - (limit.burst - 1) * limit.interval - now
+        if wait <= 0 or not only_if_free:
+            self.arrivals[key] = arrival + limit.interval
+        return wait
+        
+    async def acquire(self, key: str = "default", platform: Optional[str] = None) -> bool:
+        wait_time = self._reserve(key, self.limit_for(platform), time.monotonic())
+        if wait_time > 0:
+            logging.warning("Rate limit reached for %s. Waiting %.2fs", key, wait_time)
+            await asyncio.sleep(wait_time)
+        return True
+    
+    def try_acquire(self, key: str = "default", platform: Optional[str] = None) -> bool:
+        """Take a slot only if one is free right now; never waits."""
+        return self._reserve(key, self.limit_for(platform), time.monotonic(), only_if_free=True) <= 0
+
+class SharedRateLimiter(RateLimiter):
+    """RateLimiter whose GCRA state lives in shared memory across processes.
+
+    Keys hash into a fixed table of arrival times guarded by one lock, so
+    every worker process draws from the same per-host budget. A hash
+    collision makes two hosts share a bucket, which only errs on the side of
+    sending fewer requests. The monotonic clock is system-wide, so arrival
+    times compare correctly between processes.
+    """
+
+    SLOTS = 4096
+
+    def __init__(self, arrivals: Any = None, **kwargs):
+        super().__init__(**kwargs)
+        self.arrivals = arrivals if arrivals is not None else self.create_table()
+    
+    @classmethod
+    def create_table(cls, context: Any = None) -> Any:
+        return (context or multiprocessing).Array('d', cls.SLOTS)
+    
+    def _reserve(self, key: str, limit: RateLimitConfig, now: float, only_if_free: bool = False) -> float:
+        slot = zlib.crc32(key.encode('utf-8')) % len(self.arrivals)
+        with self.arrivals.get_lock():
+            arrival = max(self.arrivals[slot], now)
+            wait = arrival - (limit.burst - 1) * limit.interval - now
+            if wait <= 0 or not only_if_free:
+                self.arrivals[slot] = arrival + limit.interval
+        return wait
+
+def load_rate_limits(path: str) -> Tuple[Optional[RateLimitConfig], Dict[str, RateLimitConfig]]:
+    """Load rate limits from JSON: {"default": {...}, "platforms": {"github": {...}}}."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    default = RateLimitConfig.from_dict(data['default']) if 'default' in data else None
+    platforms = {
+        platform: RateLimitConfig.from_dict(limit)
+        for platform, limit in data.get('platforms', {}).items()
+    }
+    return default, platforms
+
+def proxy_label(proxy: str) -> str:
+    """host:port of a proxy URL, without any credentials."""
+    return urlparse(proxy).netloc.rpartition('@')[2]
+
+@dataclass
+class ProxyStats:
+    url: str
+    latency_ewma: float = 1.0
+    error_rate: float = 0.0
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    quarantines: int = 0
+    quarantined_until: float = 0.0
+
+class ProxyPool:
+    """Health-scored proxy selection with a keep-alive connection pool per proxy.
+
+    Selection is weighted towards proxies with low latency and error rate.
+    Proxies that keep failing are quarantined with exponential backoff and
+    come back on probation once it expires.
+    """
+
+    def __init__(
+        self,
+        proxies: Iterable[str],
+        connections_per_proxy: int = 20,
+        failure_threshold: int = 3,
+        quarantine_seconds: float = 30.0,
+        max_quarantine_seconds: float = 600.0,
+        trace_configs: Optional[List[aiohttp.TraceConfig]] = None
+    ):
+        self.proxies = {url: ProxyStats(url) for url in proxies}
+        self.connections_per_proxy = connections_per_proxy
+        self.failure_threshold = failure_threshold
+        self.quarantine_seconds = quarantine_seconds
+        self.max_quarantine_seconds = max_quarantine_seconds
+        self.trace_configs = trace_configs
+        self.sessions: Dict[str, aiohttp.ClientSession] = {}
+    
+    def __len__(self) -> int:
+        return len(self.proxies)
+    
+    def session_for(self, proxy: str) -> aiohttp.ClientSession:
+        session = self.sessions.get(proxy)
+        if session is None or session.closed:
+            session = self.sessions[proxy] = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15),
+                connector=aiohttp.TCPConnector(ssl=False, limit=self.connections_per_proxy),
+                trace_configs=self.trace_configs
+            )
+        return session
+    
+    def select(self) -> Optional[str]:
+        if not self.proxies:
+            return None
+        now = time.monotonic()
+        healthy = [stats for stats in self.proxies.values() if stats.quarantined_until <= now]
+        if not healthy:
+            return min(self.proxies.values(), key=lambda stats: stats.quarantined_until).url
+        
+        weights = [(1 - stats.error_rate) ** 2 / max(stats.latency_ewma, 0.01) + 1e-6 for stats in healthy]
+        return random.choices(healthy, weights=weights)[0].url
+    
+    def record_success(self, proxy: str, latency: float):
+        stats = self.proxies.get(proxy)
+        if stats is None:
+            return
+        stats.successes += 1
+        stats.consecutive_failures = 0
+        stats.latency_ewma = latency if stats.successes == 1 else 0.8 * stats.latency_ewma + 0.2 * latency
+        stats.error_rate *= 0.9
+        if stats.quarantines and stats.error_rate < 0.1:
+            stats.quarantines = 0
+    
+    def record_failure(self, proxy: str):
+        stats = self.proxies.get(proxy)
+        if stats is None:
+            return
+        stats.failures += 1
+        stats.consecutive_failures += 1
+        stats.error_rate = 0.9 * stats.error_rate + 0.1
+        if stats.consecutive_failures >= self.failure_threshold or stats.error_rate > 0.5:
+            backoff = min(self.max_quarantine_seconds, self.quarantine_seconds * 2 ** stats.quarantines)
+            stats.quarantined_until = time.monotonic() + backoff
+            stats.quarantines += 1
+            stats.consecutive_failures = 0
+            logging.warning("Proxy %s quarantined for %.0fs", proxy_label(proxy), backoff)
+    
+    async def health_check(self, test_url: str, timeout: float = 10.0) -> Dict[str, bool]:
+        async def check(proxy: str) -> bool:
+            started = time.monotonic()
+            try:
+                async with self.session_for(proxy).head(
+                    test_url,
+                    proxy=proxy,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    if response.status == 407:
+                        raise aiohttp.ClientError("proxy authentication required")
+                self.record_success(proxy, time.monotonic() - started)
+                return True
+            except Exception as error:
+                logging.debug("Proxy health check failed for %s: %s", proxy_label(proxy), error)
+                for _ in range(self.failure_threshold):
+                    self.record_failure(proxy)
+                return False
+        
+        proxies = list(self.proxies)
+        results = await asyncio.gather(*[check(proxy) for proxy in proxies])
+        healthy = sum(results)
+        logging.info(f"{Colors.CYAN}🛡️ Proxy health check: {healthy}/{len(proxies)} healthy{Colors.END}")
+        return dict(zip(proxies, results))
+    
+    def stats(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            {
+                'proxy': proxy_label(stats.url),
+                'latency_ms': stats.latency_ewma * 1000,
+                'error_rate': stats.error_rate,
+                'successes': stats.successes,
+                'failures': stats.failures,
+                'quarantined': stats.quarantined_until > now
+            }
+            for stats in self.proxies.values()
         ]
+    
+    async def close(self):
+        for session in self.sessions.values():
+            await session.close()
+        self.sessions.clear()
+
+@dataclass
+class ProbeStrategy:
+    method: str = 'GET'
+    follow_redirects: bool = True
+    max_redirects: int = 3
+    body_bytes: int = 0
+
+@dataclass
+class ProbeResult:
+    status: int
+    final_url: str
+    retry_after: Optional[float] = None
+    body: bytes = b''
+    proxy: Optional[str] = None
+
+class SignatureMatcher:
+    """A platform's found and missing body signatures compiled into one regex.
+
+    A body prefix is scanned once for all of them, stopping as soon as every
+    kind of signature has been seen.
+    """
+
+    def __init__(self, found: Iterable[str] = (), missing: Iterable[str] = ()):
+        found, missing = list(found), list(missing)
+        groups = []
+        for kind, signatures in (('found', found), ('missing', missing)):
+            if signatures:
+                alternatives = b'|'.join(re.escape(signature.encode('utf-8')) for signature in signatures)
+                groups.append(b'(?P<' + kind.encode('ascii') + b'>' + alternatives + b')')
+        self.requires_found = bool(found)
+        self.kinds = len(groups)
+        self.pattern = re.compile(b'|'.join(groups))
+    
+    def scan(self, body: bytes) -> set:
+        seen = set()
+        for match in self.pattern.finditer(body):
+            seen.add(match.lastgroup)
+            if len(seen) == self.kinds:
+                break
+        return seen
+
+@dataclass
+class PlatformRule:
+    """How one platform is addressed, probed and judged, as loaded from the registry."""
+    name: str
+    url: str
+    username_pattern: Optional[re.Pattern] = None
+    found_status: Tuple[int, ...] = (200, 206)
+    missing_url: Tuple[str, ...] = ()
+    exact_url: bool = False
+    probe: ProbeStrategy = None
+    signatures: Optional[SignatureMatcher] = None
+    
+    def __post_init__(self):
+        if self.probe is None:
+            self.probe = ProbeStrategy()
+    
+    def accepts(self, username: str) -> bool:
+        return self.username_pattern is None or self.username_pattern.fullmatch(username) is not None
+    
+    def is_found(self, status: int, url: str, final_url: str, body: bytes = b'') -> bool:
+        if status not in self.found_status:
+            return False
+        if self.exact_url and final_url != url:
+            return False
+        if any(marker in final_url for marker in self.missing_url):
+            return False
+        if self.signatures:
+            seen = self.signatures.scan(body)
+            if 'missing' in seen:
+                return False
+            if self.signatures.requires_found and 'found' not in seen:
+                return False
+        return True
+    
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> 'PlatformRule':
+        url = data['url']
+        if '{}' not in url:
+            raise ValueError(f"{name}: url template has no '{{}}' placeholder")
+        try:
+            username_pattern = re.compile(data['username']) if data.get('username') else None
+        except re.error as error:
+            raise ValueError(f"{name}: invalid username pattern: {error}") from error
         
-        if len(self.requests[key]) >= self.max_requests:
-            oldest_request = min(self.requests[key])
-            wait_time = self.time_window - (current_time - oldest_request)
-            logging.warning(f"Rate limit reached for {key}. Waiting {wait_time:.2f}s")
-            await asyncio.sleep(wait_time + 0.1)
-            return await self.acquire(key)
+        found_body = data.get('found_body', [])
+        missing_body = data.get('missing_body', [])
+        probe = ProbeStrategy(**data.get('probe', {}))
+        if found_body or missing_body:
+            if probe.method != 'GET':
+                raise ValueError(f"{name}: body signatures need a GET probe")
+            probe.body_bytes = probe.body_bytes or SIGNATURE_WINDOW
         
-        self.requests[key].append(current_time)
+        return cls(
+            name=name,
+            url=url,
+            username_pattern=username_pattern,
+            found_status=tuple(data.get('found_status', cls.found_status)),
+            missing_url=tuple(data.get('missing_url', ())),
+            exact_url=bool(data.get('exact_url', False)),
+            probe=probe,
+            signatures=SignatureMatcher(found_body, missing_body) if found_body or missing_body else None
+        )
+
+SIGNATURE_WINDOW = 32768
+DEFAULT_PLATFORMS_PATH = Path(__file__).with_name('platforms.json')
+
+def load_platforms(path: Optional[str] = None) -> Dict[str, PlatformRule]:
+    """Load the platform registry: {"platforms": {"github": {"url": ..., ...}}}.
+
+    Raises OSError for an unreadable file and ValueError for a malformed one.
+    """
+    with open(path or DEFAULT_PLATFORMS_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    try:
+        return {
+            name: PlatformRule.from_dict(name, entry)
+            for name, entry in data['platforms'].items()
+        }
+    except (KeyError, TypeError) as error:
+        raise ValueError(f"malformed platform registry: {error}") from error
+
+@dataclass
+class Retry:
+    """Returned by a job that wants another attempt after ``delay`` seconds.
+
+    ``result`` is reported instead if the retry budget refuses the attempt.
+    """
+    delay: float
+    result: Any
+    factory: Optional[Callable[[], Awaitable[Any]]] = None
+
+@dataclass
+class ScanJob:
+    key: Any
+    host: str
+    factory: Callable[[], Awaitable[Any]]
+    deadline: Optional[float] = None
+
+class DeadlineExceeded(Exception):
+    """Yielded by the scheduler for jobs that could not finish before their deadline."""
+
+@dataclass
+class HostState:
+    limit: float
+    latency_ewma: float = 0.0
+    latency_baseline: float = 0.0
+    last_decrease: float = 0.0
+    blocked_until: float = 0.0
+
+def parse_retry_after(value: Optional[str], cap: float = 300.0) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), cap)
+
+class AdaptiveConcurrency:
+    """AIMD per-host concurrency limits.
+
+    Healthy responses grow a host's limit by about one slot per round of
+    requests. 429/503s, timeouts or latency well above the host's baseline
+    cut it multiplicatively, at most once per round trip so one burst of
+    failures counts once. Retry-After pauses the host outright.
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0
+    ):
+        self.initial = max(min_limit, initial)
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.initial, max_limit)
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.hosts: Dict[str, HostState] = {}
+    
+    def _state(self, host: str) -> HostState:
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = HostState(limit=float(self.initial))
+        return state
+    
+    def limit(self, host: str) -> int:
+        state = self.hosts.get(host)
+        return max(self.min_limit, int(state.limit)) if state else self.initial
+    
+    def delay(self, host: str) -> float:
+        state = self.hosts.get(host)
+        return max(0.0, state.blocked_until - time.monotonic()) if state else 0.0
+    
+    def _decrease(self, state: HostState, factor: float):
+        now = time.monotonic()
+        if now - state.last_decrease < max(state.latency_ewma, 0.1):
+            return
+        state.last_decrease = now
+        state.limit = max(self.min_limit, state.limit * factor)
+    
+    def record_success(self, host: str, latency: float):
+        state = self._state(host)
+        state.latency_ewma = latency if not state.latency_ewma else 0.8 * state.latency_ewma + 0.2 * latency
+        if not state.latency_baseline or state.latency_ewma < state.latency_baseline:
+            state.latency_baseline = state.latency_ewma
+        else:
+            state.latency_baseline += (state.latency_ewma - state.latency_baseline) * 0.01
+        
+        if state.latency_ewma > state.latency_baseline * self.latency_tolerance:
+            self._decrease(state, 0.9)
+        else:
+            state.limit = min(self.max_limit, state.limit + 1 / state.limit)
+    
+    def record_throttle(self, host: str, retry_after: Optional[float] = None):
+        state = self._state(host)
+        self._decrease(state, self.backoff)
+        if retry_after:
+            state.blocked_until = max(state.blocked_until, time.monotonic() + retry_after)
+            logging.warning("%s asked us to back off for %.1fs", host, retry_after)
+
+class RetryBudget:
+    """Caps retries at a fraction of first attempts so an outage can't multiply load.
+
+    Every new job deposits ``ratio`` tokens and every retry spends one. The
+    balance starts at ``min_retries`` and never exceeds ``max_tokens``.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, max_tokens: float = 100):
+        self.ratio = ratio
+        self.max_tokens = max(max_tokens, min_retries)
+        self.tokens = float(min_retries)
+        self.spent = 0
+        self.refused = 0
+    
+    def deposit(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+    
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            self.refused += 1
+            return False
+        self.tokens -= 1
+        self.spent += 1
         return True
 
-class DNSAnalyzer:
+class LatencyTracker:
+    """Sliding window of recent successful probe latencies per platform.
+
+    Until a platform has ``min_samples`` of its own, its percentile comes
+    from the latencies of all platforms together, so a single-username scan
+    has a threshold after its first couple of dozen checks.
+    """
+
+    POOLED = '*'
+
+    def __init__(self, window: int = 100, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self.samples: Dict[str, deque] = {}
+    
+    def record(self, key: str, latency: float):
+        for name in (key, self.POOLED):
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = deque(maxlen=self.window)
+            samples.append(latency)
+    
+    def percentile(self, key: str, pct: float = 95) -> Optional[float]:
+        for name in (key, self.POOLED):
+            samples = self.samples.get(name)
+            if samples and len(samples) >= self.min_samples:
+                ordered = sorted(samples)
+                return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+        return None
+
+HEDGE_POLL_INTERVAL = 0.25
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus style."""
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def merge(self, other: 'Histogram'):
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-th quantile (inf past the last bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+class ScanMetrics:
+    """Counters, gauges and latency histograms describing where scan time goes.
+
+    Series are keyed by name plus labels, e.g. ``observe('platform_request_seconds',
+    0.2, platform='github')``. ``trace_config`` instruments aiohttp sessions
+    for DNS resolution time and connection reuse. Everything can be exported
+    as Prometheus text or JSON, and merged across worker processes.
+    """
+
+    PREFIX = 'handy_reaper_'
+
     def __init__(self):
-        self.resolver = dns.resolver.Resolver()
-        self.resolver.timeout = 5
-        self.resolver.lifetime = 5
+        self.counters: Dict[Tuple[str, Tuple], float] = defaultdict(float)
+        self.gauges: Dict[Tuple[str, Tuple], float] = {}
+        self.histograms: Dict[Tuple[str, Tuple], Histogram] = {}
+    
+    def inc(self, name: str, value: float = 1, **labels: str):
+        self.counters[(name, tuple(sorted(labels.items())))] += value
+    
+    def set(self, name: str, value: float, **labels: str):
+        self.gauges[(name, tuple(sorted(labels.items())))] = value
+    
+    def observe(self, name: str, value: float, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(value)
+    
+    def merge(self, other: 'ScanMetrics'):
+        for key, value in other.counters.items():
+            self.counters[key] += value
+        for key, value in other.gauges.items():
+            self.gauges[key] = self.gauges.get(key, 0) + value
+        for key, histogram in other.histograms.items():
+            if key in self.histograms:
+                self.histograms[key].merge(histogram)
+            else:
+                self.histograms[key] = histogram
+    
+    def trace_config(self) -> aiohttp.TraceConfig:
+        loop_time = lambda: asyncio.get_running_loop().time()
+        
+        async def dns_start(session, ctx, params):
+            ctx.dns_started = loop_time()
+        
+        async def dns_end(session, ctx, params):
+            self.observe('dns_resolve_seconds', loop_time() - ctx.dns_started)
+        
+        async def dns_cache(result: str, session, ctx, params):
+            self.inc('dns_cache_total', result=result)
+        
+        async def connect_start(session, ctx, params):
+            ctx.connect_started = loop_time()
+        
+        async def connect_end(session, ctx, params):
+            self.observe('connection_create_seconds', loop_time() - ctx.connect_started)
+            self.inc('connections_total', reused='false')
+        
+        async def connection_reused(session, ctx, params):
+            self.inc('connections_total', reused='true')
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_dns_resolvehost_start.append(dns_start)
+        trace_config.on_dns_resolvehost_end.append(dns_end)
+        trace_config.on_dns_cache_hit.append(partial(dns_cache, 'hit'))
+        trace_config.on_dns_cache_miss.append(partial(dns_cache, 'miss'))
+        trace_config.on_connection_create_start.append(connect_start)
+        trace_config.on_connection_create_end.append(connect_end)
+        trace_config.on_connection_reuseconn.append(connection_reused)
+        return trace_config
+    
+    @staticmethod
+    def _labels(labels: Tuple, extra: str = '') -> str:
+        parts = []
+        for key, value in labels:
+            value = str(value).replace('\\', '\\\\').replace('"', '\\"')
+            parts.append(f'{key}="{value}"')
+        if extra:
+            parts.append(extra)
+        return '{' + ','.join(parts) + '}' if parts else ''
+    
+    def to_prometheus(self) -> str:
+        lines = []
+        typed = set()
+        
+        def header(name: str, kind: str):
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {self.PREFIX}{name} {kind}")
+        
+        for (name, labels), value in sorted(self.counters.items()):
+            header(name, 'counter')
+            lines.append(f"{self.PREFIX}{name}{self._labels(labels)} {value:g}")
+        for (name, labels), value in sorted(self.gauges.items()):
+            header(name, 'gauge')
+            lines.append(f"{self.PREFIX}{name}{self._labels(labels)} {value:g}")
+        for (name, labels), histogram in sorted(self.histograms.items(), key=lambda item: item[0]):
+            header(name, 'histogram')
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                bucket_labels = self._labels(labels, f'le="{le}"')
+                lines.append(f"{self.PREFIX}{name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.PREFIX}{name}_sum{self._labels(labels)} {histogram.sum:.6f}")
+            lines.append(f"{self.PREFIX}{name}_count{self._labels(labels)} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+    
+    def to_dict(self) -> Dict[str, Any]:
+        def series(items):
+            grouped = defaultdict(list)
+            for (name, labels), value in sorted(items, key=lambda item: item[0]):
+                grouped[name].append({'labels': dict(labels), **value})
+            return dict(grouped)
+        
+        return {
+            'counters': series((key, {'value': value}) for key, value in self.counters.items()),
+            'gauges': series((key, {'value': value}) for key, value in self.gauges.items()),
+            'histograms': series((key, {
+                'count': histogram.count,
+                'sum': histogram.sum,
+                'mean': histogram.sum / histogram.count if histogram.count else None,
+                'p50': histogram.quantile(0.5),
+                'p95': histogram.quantile(0.95),
+                'p99': histogram.quantile(0.99),
+                'buckets': dict(zip([f"{bound:g}" for bound in histogram.buckets] + ['+Inf'], histogram.counts))
+            }) for key, histogram in self.histograms.items()),
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def write(self, path: str):
+        """Write JSON for paths ending in .json, Prometheus text exposition otherwise."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith('.json'):
+                json.dump(self.to_dict(), f, indent=2, default=str)
+            else:
+                f.write(self.to_prometheus())
+
+async def aiterate(items: Union[Iterable[Any], AsyncIterable[Any]]) -> AsyncIterator[Any]:
+    """Iterate a plain or async iterable from async code."""
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+class ScanScheduler:
+    """Worker pool fed from a queue with global and per-host concurrency limits.
+
+    Jobs whose host is already at its limit, or paused by the controller, are
+    parked and handed back to the queue when that host can take them, so the
+    other workers keep going. A job returning ``Retry`` goes onto a timer heap
+    and its worker moves straight on to the next job.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        per_host_limit: int = 2,
+        controller: Optional[AdaptiveConcurrency] = None,
+        retry_budget: Optional[RetryBudget] = None
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.controller = controller
+        self.retry_budget = retry_budget or RetryBudget()
+        self.active = defaultdict(int)
+        self.deferred = defaultdict(deque)
+        self.wakeups = {}
+        self.retry_heap = []
+        self.retry_seq = itertools.count()
+        self.retry_timer = None
+        self._slots = None
+        self._slots_loop = None
+
+    def slots(self) -> asyncio.Semaphore:
+        """Global in-flight limit shared by every concurrent ``map()`` on this loop."""
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._slots_loop = loop
+        return self._slots
+
+    def host_limit(self, host: str) -> int:
+        return self.controller.limit(host) if self.controller else self.per_host_limit
+    
+    def host_delay(self, host: str) -> float:
+        return self.controller.delay(host) if self.controller else 0.0
+    
+    def _park(self, host: str, ready: asyncio.Queue, job: ScanJob, delay: float = 0.0):
+        self.deferred[host].append((ready, job))
+        if delay > 0 and host not in self.wakeups:
+            self.wakeups[host] = asyncio.get_running_loop().call_later(delay, self._wake, host)
+    
+    def _wake(self, host: str):
+        self.wakeups.pop(host, None)
+        parked = self.deferred.get(host)
+        slots = self.host_limit(host) - self.active.get(host, 0)
+        while parked and slots > 0:
+            ready, job = parked.popleft()
+            ready.put_nowait(job)
+            slots -= 1
+        if parked is not None and not parked:
+            del self.deferred[host]
+
+    def _release_host(self, host: str):
+        self.active[host] -= 1
+        if self.active[host] <= 0:
+            del self.active[host]
+        delay = self.host_delay(host)
+        if delay > 0:
+            if host in self.deferred and host not in self.wakeups:
+                self.wakeups[host] = asyncio.get_running_loop().call_later(delay, self._wake, host)
+            return
+        self._wake(host)
+
+    def _schedule_retry(self, ready: asyncio.Queue, job: ScanJob, delay: float):
+        loop = asyncio.get_running_loop()
+        due = loop.time() + delay
+        heapq.heappush(self.retry_heap, (due, next(self.retry_seq), ready, job))
+        if self.retry_timer is None or due < self.retry_timer.when():
+            if self.retry_timer:
+                self.retry_timer.cancel()
+            self.retry_timer = loop.call_at(due, self._fire_retries)
+    
+    def _fire_retries(self):
+        loop = asyncio.get_running_loop()
+        self.retry_timer = None
+        now = loop.time()
+        while self.retry_heap and self.retry_heap[0][0] <= now:
+            _, _, ready, job = heapq.heappop(self.retry_heap)
+            ready.put_nowait(job)
+        if self.retry_heap:
+            self.retry_timer = loop.call_at(self.retry_heap[0][0], self._fire_retries)
+
+    async def map(self, jobs: Union[Iterable[ScanJob], AsyncIterable[ScanJob]]) -> AsyncIterator[Tuple[Any, Any]]:
+        """Run jobs and yield (key, result) pairs in completion order.
+
+        ``jobs`` may be an async iterable, and is only drawn from as
+        admission slots free up. Exceptions raised by a job are yielded as
+        its result; an exception raised by ``jobs`` itself is raised here.
+        """
+        ready = asyncio.Queue()
+        done = asyncio.Queue()
+        slots = self.slots()
+        parked = object()
+        admitted = asyncio.Semaphore(self.max_concurrency * 4)
+        state = {'submitted': 0, 'completed': 0, 'fed': False}
+        
+        async def feeder():
+            try:
+                async for job in aiterate(jobs):
+                    await admitted.acquire()
+                    state['submitted'] += 1
+                    self.retry_budget.deposit()
+                    ready.put_nowait(job)
+            except Exception as error:
+                # The job source failed (e.g. an unreadable target file):
+                # hand the error to map() instead of leaving it waiting
+                done.put_nowait(error)
+            else:
+                state['fed'] = True
+                done.put_nowait(None)
+        
+        loop = asyncio.get_running_loop()
+        
+        def remaining(job: ScanJob) -> Optional[float]:
+            return None if job.deadline is None else job.deadline - loop.time()
+        
+        async def attempt(job: ScanJob) -> Any:
+            """Run ``job`` if its host can take it; otherwise park it and return ``parked``."""
+            time_left = remaining(job)
+            if time_left is not None and time_left <= 0:
+                return DeadlineExceeded()
+            
+            delay = self.host_delay(job.host)
+            if delay > 0 or self.active.get(job.host, 0) >= self.host_limit(job.host):
+                self._park(job.host, ready, job, delay if time_left is None else min(delay, time_left))
+                return parked
+            
+            self.active[job.host] += 1
+            try:
+                if time_left is None:
+                    return await job.factory()
+                return await asyncio.wait_for(job.factory(), time_left)
+            except asyncio.TimeoutError as error:
+                expired = remaining(job)
+                return DeadlineExceeded() if expired is not None and expired <= 0 else error
+            except Exception as error:
+                return error
+            finally:
+                self._release_host(job.host)
+        
+        async def worker():
+            while True:
+                job = await ready.get()
+                async with slots:
+                    result = await attempt(job)
+                if result is parked:
+                    continue
+                
+                if isinstance(result, Retry):
+                    time_left = remaining(job)
+                    fits = time_left is None or result.delay < time_left
+                    if result.factory and fits and self.retry_budget.withdraw():
+                        job.factory = result.factory
+                        self._schedule_retry(ready, job, result.delay * random.uniform(1.0, 1.5))
+                        continue
+                    result = result.result
+                
+                admitted.release()
+                done.put_nowait((job.key, result))
+        
+        tasks = [asyncio.ensure_future(feeder())]
+        tasks += [asyncio.ensure_future(worker()) for _ in range(self.max_concurrency)]
+        
+        try:
+            while not (state['fed'] and state['completed'] == state['submitted']):
+                item = await done.get()
+                if item is None:
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                state['completed'] += 1
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for host in list(self.deferred):
+                parked = deque(entry for entry in self.deferred[host] if entry[0] is not ready)
+                if parked:
+                    self.deferred[host] = parked
+                else:
+                    del self.deferred[host]
+            self.retry_heap = [entry for entry in self.retry_heap if entry[2] is not ready]
+            heapq.heapify(self.retry_heap)
+
+class DNSCache:
+    """LRU cache of DNS answers that honours record TTLs.
+
+    Negative answers (NXDOMAIN/NoAnswer) are cached for ``negative_ttl``
+    seconds. With ``path`` set, unexpired entries are loaded on start and
+    written back by ``save()`` so repeated runs start warm.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 50000,
+        negative_ttl: int = 300,
+        max_ttl: int = 86400,
+        path: Optional[str] = None
+    ):
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self.max_ttl = max_ttl
+        self.path = path
+        self.entries: 'OrderedDict[Tuple[str, str], Tuple[float, List[str]]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            self.load(path)
+    
+    def get(self, domain: str, record_type: str) -> Optional[List[str]]:
+        key = (domain.lower().rstrip('.'), record_type)
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+        
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, domain: str, record_type: str, records: List[str], ttl: Optional[int] = None):
+        ttl = self.negative_ttl if ttl is None else min(ttl, self.max_ttl)
+        if ttl <= 0:
+            return
+        key = (domain.lower().rstrip('.'), record_type)
+        self.entries[key] = (time.time() + ttl, records)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.entries),
+            'hit_rate': (self.hits / lookups) * 100 if lookups else 0
+        }
+    
+    def load(self, path: str):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as error:
+            logging.warning(f"Could not load DNS cache {path}: {error}")
+            return
+        
+        now = time.time()
+        for domain, record_type, expires, records in stored:
+            if expires > now:
+                self.entries[(domain, record_type)] = (expires, records)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+    
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        if not path:
+            return
+        now = time.time()
+        stored = [
+            [domain, record_type, expires, records]
+            for (domain, record_type), (expires, records) in self.entries.items()
+            if expires > now
+        ]
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+class DNSAnalyzer:
+    RECORD_TYPES = ['A', 'AAAA', 'MX', 'TXT', 'NS', 'CNAME']
+    
+    def __init__(self, cache: Optional[DNSCache] = None, metrics: Optional[ScanMetrics] = None):
+        self._resolver = None
+        self.cache = cache or DNSCache()
+        self.metrics = metrics or ScanMetrics()
+    
+    @property
+    def resolver(self) -> 'dns.asyncresolver.Resolver':
+        if self._resolver is None:
+            import dns.asyncresolver
+            self._resolver = dns.asyncresolver.Resolver()
+            self._resolver.timeout = 5
+            self._resolver.lifetime = 5
+        return self._resolver
         
     async def analyze_domain(self, domain: str) -> Dict[str, Any]:
         results = {
@@ -120,29 +1152,63 @@ class DNSAnalyzer:
         }
         
         try:
-            record_types = ['A', 'AAAA', 'MX', 'TXT', 'NS', 'CNAME']
-            for record_type in record_types:
-                results['records'][record_type] = await self._get_dns_records(domain, record_type)
+            *answers, dmarc = await asyncio.gather(
+                *[self._get_dns_records(domain, record_type) for record_type in self.RECORD_TYPES],
+                self._get_dns_records(f"_dmarc.{domain}", 'TXT')
+            )
+            results['records'] = dict(zip(self.RECORD_TYPES, answers))
             
-            results['security'] = await self._check_security(domain, results['records'])
+            results['security'] = await self._check_security(domain, results['records'], dmarc)
             
         except Exception as error:
             results['error'] = str(error)
-            logging.error(f"DNS analysis failed for {domain}: {error}")
+            logging.error("DNS analysis failed for %s: %s", domain, error)
         
         return results
     
+    async def analyze_domains(self, domains: Iterable[str], concurrency: int = 50) -> AsyncIterator[Dict[str, Any]]:
+        """Analyze a stream of domains with bounded concurrency, yielding results as they finish."""
+        scheduler = ScanScheduler(max_concurrency=concurrency, per_host_limit=1)
+        jobs = (
+            ScanJob(key=domain, host=domain, factory=partial(self.analyze_domain, domain))
+            for domain in domains
+        )
+        async for domain, result in scheduler.map(jobs):
+            if isinstance(result, Exception):
+                result = {'domain': domain, 'error': str(result)}
+            yield result
+    
     async def _get_dns_records(self, domain: str, record_type: str) -> List[str]:
+        cached = self.cache.get(domain, record_type)
+        if cached is not None:
+            return cached
+        
+        import dns.exception
+        import dns.resolver
+        started = time.monotonic()
+        outcome = 'answer'
         try:
-            answers = self.resolver.resolve(domain, record_type)
-            return [str(rdata) for rdata in answers]
-        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.exception.Timeout):
+            answers = await self.resolver.resolve(domain, record_type)
+            records = [str(rdata) for rdata in answers]
+            self.cache.put(domain, record_type, records, answers.rrset.ttl)
+            return records
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            outcome = 'empty'
+            self.cache.put(domain, record_type, [])
+            return []
+        except dns.exception.Timeout:
+            outcome = 'timeout'
             return []
         except Exception as error:
-            logging.debug(f"DNS lookup failed for {domain} ({record_type}): {error}")
+            outcome = 'error'
+            logging.debug("DNS lookup failed for %s (%s): %s", domain, record_type, error)
             return []
+        finally:
+            self.metrics.observe('dns_query_seconds', time.monotonic() - started, record_type=record_type)
+            self.metrics.inc('dns_queries_total', record_type=record_type, outcome=outcome)
     
-    async def _check_security(self, domain: str, records: Dict) -> Dict[str, Any]:
+    async def _check_security(self, domain: str, records: Dict, dmarc: Iterable[str] = ()) -> Dict[str, Any]:
+        """SPF and DKIM hints come from the apex TXT records, DMARC from ``_dmarc.<domain>``."""
         security = {
             'spf_configured': False,
             'dmarc_configured': False,
@@ -153,252 +1219,1180 @@ class DNSAnalyzer:
             txt_lower = txt.lower()
             if 'v=spf1' in txt_lower:
                 security['spf_configured'] = True
-            if 'v=dmarc1' in txt_lower:
-                security['dmarc_configured'] = True
             if 'dkim' in txt_lower:
                 security['dkim_hints'] = True
         
-        return security
+        for txt in dmarc:
+            if 'v=dmarc1' in txt.lower():
+                security['dmarc_configured'] = True
+                security['dmarc_policy'] = txt.strip('"')
+        
+        return security
+
+class ResultCache:
+    """SQLite store of platform check outcomes with per-status TTLs.
+
+    Found profiles are trusted for longer than misses, and errors or
+    timeouts only briefly. ``max_age`` caps every TTL so a sweep can force
+    re-checks of anything older.
+    """
+
+    DEFAULT_TTLS = {
+        'found': 7 * 86400,
+        'not_found': 86400,
+        'timeout': 300,
+        'error': 300,
+        'failed': 300,
+        'throttled': 300,
+    }
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[Dict[str, float]] = None,
+        max_age: Optional[float] = None,
+        commit_every: int = 100,
+        busy_timeout: float = 30.0
+    ):
+        self.path = path
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.max_age = max_age
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(path, timeout=busy_timeout)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS checks ("
+            "platform TEXT NOT NULL, username TEXT NOT NULL, status TEXT NOT NULL, "
+            "result TEXT NOT NULL, checked_at REAL NOT NULL, "
+            "PRIMARY KEY (platform, username))"
+        )
+        self.conn.commit()
+        
+        # Writes are committed in short batches by a thread with its own
+        # connection, so waiting for the write lock (another --workers process
+        # may hold it) never blocks the event loop or fails a check
+        self.writes = queue.SimpleQueue()
+        self.writer = threading.Thread(target=self._write_loop, args=(busy_timeout,), name='result-cache-writer', daemon=True)
+        self.writer.start()
+    
+    def _write_loop(self, busy_timeout: float):
+        conn = sqlite3.connect(self.path, timeout=busy_timeout)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            rows, waiters = [], []
+            item = self.writes.get()
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    rows.append(item)
+                if not running or len(rows) >= self.commit_every:
+                    break
+                try:
+                    item = self.writes.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if rows:
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO checks (platform, username, status, result, checked_at) VALUES (?, ?, ?, ?, ?)",
+                            rows
+                        )
+                except sqlite3.Error as error:
+                    logging.warning(f"Result cache dropped {len(rows)} writes: {error}")
+            for waiter in waiters:
+                waiter.set()
+        conn.close()
+    
+    def ttl_for(self, status: str) -> float:
+        ttl = self.ttls.get(status, self.ttls['error'])
+        return min(ttl, self.max_age) if self.max_age is not None else ttl
+    
+    def get(self, platform: str, username: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            "SELECT status, result, checked_at FROM checks WHERE platform = ? AND username = ?",
+            (platform, username)
+        ).fetchone()
+        if row is None or time.time() - row[2] >= self.ttl_for(row[0]):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return json.loads(row[1])
+    
+    def put(self, platform: str, username: str, result: Dict[str, Any]):
+        self.writes.put((platform, username, result.get('status', 'error'), json.dumps(result), time.time()))
+    
+    def flush(self):
+        """Wait until every queued write is committed."""
+        if not self.writer.is_alive():
+            return
+        committed = threading.Event()
+        self.writes.put(committed)
+        committed.wait()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups) * 100 if lookups else 0
+        }
+    
+    def close(self):
+        if self.writer.is_alive():
+            self.writes.put(None)
+            self.writer.join()
+        self.conn.close()
+
+class FindingsStore:
+    """Indexed SQLite history of finished scans, one row per platform check.
+
+    Every run of a username is kept so findings can be searched by platform,
+    status and time, and two runs can be diffed. Runs are unique on
+    (username, timestamp), so importing the report of a run that was already
+    recorded live is a no-op. Several processes may write to the same file:
+    live scans are committed in short batches by a writer thread, so the
+    write lock is only held briefly and waiting for it never blocks the
+    event loop.
+    """
+    
+    def __init__(self, path: str, commit_every: int = 500, busy_timeout: float = 30.0):
+        self.path = path
+        self.commit_every = commit_every
+        self.pending_writes = 0
+        self.conn = sqlite3.connect(path, timeout=busy_timeout)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "id INTEGER PRIMARY KEY, username TEXT NOT NULL, scanned_at REAL NOT NULL, "
+            "found INTEGER NOT NULL, total INTEGER NOT NULL, source TEXT, "
+            "UNIQUE (username, scanned_at));"
+            "CREATE TABLE IF NOT EXISTS findings ("
+            "run_id INTEGER NOT NULL REFERENCES runs (id), platform TEXT NOT NULL, "
+            "username TEXT NOT NULL, status TEXT NOT NULL, status_code INTEGER, url TEXT, "
+            "scanned_at REAL NOT NULL, PRIMARY KEY (run_id, platform)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS findings_platform ON findings (platform, status, scanned_at);"
+            "CREATE INDEX IF NOT EXISTS findings_username ON findings (username, scanned_at);"
+            "CREATE INDEX IF NOT EXISTS findings_status ON findings (status, scanned_at);"
+        )
+        self.conn.commit()
+        
+        self.writes = queue.SimpleQueue()
+        self.writer = threading.Thread(target=self._write_loop, args=(busy_timeout,), name='findings-writer', daemon=True)
+        self.writer.start()
+    
+    def _write_loop(self, busy_timeout: float):
+        conn = sqlite3.connect(self.path, timeout=busy_timeout)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            scans, waiters = [], []
+            item = self.writes.get()
+            while True:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    scans.append(item)
+                if not running or len(scans) >= self.commit_every:
+                    break
+                try:
+                    item = self.writes.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if scans:
+                try:
+                    with conn:
+                        for scan, source in scans:
+                            self._insert(conn, scan, source)
+                except (sqlite3.Error, ValueError, KeyError) as error:
+                    logging.warning("Scan history dropped %d runs: %s", len(scans), error)
+            for waiter in waiters:
+                waiter.set()
+        conn.close()
+    
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, scan: Dict[str, Any], source: str) -> Optional[int]:
+        """Insert one run and its findings. Returns the run id, or None if the run is already stored."""
+        scanned_at = datetime.fromisoformat(scan['timestamp']).timestamp()
+        checks = scan.get('platform_results', {})
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO runs (username, scanned_at, found, total, source) VALUES (?, ?, ?, ?, ?)",
+            (
+                scan['username'],
+                scanned_at,
+                sum(1 for result in checks.values() if result.get('status') == 'found'),
+                scan.get('statistics', {}).get('total_platforms', len(checks)),
+                source
+            )
+        )
+        if not cursor.rowcount:
+            return None
+        
+        run_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO findings (run_id, platform, username, status, status_code, url, scanned_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (run_id, platform, scan['username'], result.get('status', 'error'),
+                 result.get('status_code'), result.get('url'), scanned_at)
+                for platform, result in checks.items()
+            ]
+        )
+        return run_id
+    
+    def record_scan(self, scan: Dict[str, Any], source: str = 'scan'):
+        """Queue a muscle_scan-shaped result for the writer thread; a run already stored is skipped."""
+        self.writes.put((scan, source))
+    
+    def import_reports(self, paths: Iterable[str]) -> Dict[str, int]:
+        """Load saved ``osint_<user>_<ts>.json`` reports; directories are searched for them."""
+        counts = {'imported': 0, 'skipped': 0, 'unreadable': 0}
+        for path in paths:
+            files = sorted(Path(path).glob('osint_*.json')) if Path(path).is_dir() else [Path(path)]
+            for report in files:
+                try:
+                    with open(report, encoding='utf-8') as f:
+                        scan = json.load(f).get('muscle_scan')
+                    run_id = self._insert(self.conn, scan, str(report)) if scan else None
+                except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+                    logging.warning("Cannot import %s: %s", report, error)
+                    counts['unreadable'] += 1
+                    continue
+                counts['imported' if run_id else 'skipped'] += 1
+                if run_id:
+                    self.pending_writes += 1
+                if self.pending_writes >= self.commit_every:
+                    self.conn.commit()
+                    self.pending_writes = 0
+        self.conn.commit()
+        self.pending_writes = 0
+        return counts
+    
+    def query(
+        self,
+        username: Optional[str] = None,
+        platform: Optional[str] = None,
+        status: Optional[str] = 'found',
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Latest matching check per (username, platform) within the time window, newest first."""
+        conditions, params = [], []
+        for column, value in (('username', username), ('platform', platform), ('status', status)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("scanned_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("scanned_at < ?")
+            params.append(until)
+        
+        sql = (
+            "SELECT username, platform, status, status_code, url, MAX(scanned_at) FROM findings"
+            + (f" WHERE {' AND '.join(conditions)}" if conditions else "")
+            + " GROUP BY username, platform ORDER BY MAX(scanned_at) DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [
+            {'username': row[0], 'platform': row[1], 'status': row[2], 'status_code': row[3], 'url': row[4], 'scanned_at': row[5]}
+            for row in self.conn.execute(sql, params)
+        ]
+    
+    def diff(self, username: str, since: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Compare the latest run of ``username`` with the previous one (or the last one before ``since``).
+
+        Returns None unless there are two runs to compare.
+        """
+        newest = self.conn.execute(
+            "SELECT id, scanned_at FROM runs WHERE username = ? ORDER BY scanned_at DESC LIMIT 1",
+            (username,)
+        ).fetchone()
+        if newest is None:
+            return None
+        before = newest[1] if since is None else min(since, newest[1])
+        older = self.conn.execute(
+            "SELECT id, scanned_at FROM runs WHERE username = ? AND scanned_at < ? ORDER BY scanned_at DESC LIMIT 1",
+            (username, before)
+        ).fetchone()
+        if older is None:
+            return None
+        
+        def statuses(run_id: int) -> Dict[str, Tuple[str, Optional[str]]]:
+            return {
+                platform: (status, url)
+                for platform, status, url in self.conn.execute(
+                    "SELECT platform, status, url FROM findings WHERE run_id = ?", (run_id,)
+                )
+            }
+        
+        old, new = statuses(older[0]), statuses(newest[0])
+        changes = {'appeared': {}, 'disappeared': {}, 'changed': {}}
+        for platform in sorted(old.keys() | new.keys()):
+            was = old.get(platform, (None, None))[0]
+            now, url = new.get(platform, (None, None))
+            if was == now:
+                continue
+            if now == 'found':
+                changes['appeared'][platform] = url
+            elif was == 'found':
+                changes['disappeared'][platform] = now
+            else:
+                changes['changed'][platform] = {'was': was, 'now': now}
+        return {
+            'username': username,
+            'old_scanned_at': older[1],
+            'new_scanned_at': newest[1],
+            'unchanged': len(old.keys() | new.keys()) - sum(len(group) for group in changes.values()),
+            **changes
+        }
+    
+    def flush(self):
+        """Wait until every queued scan is committed."""
+        if not self.writer.is_alive():
+            return
+        committed = threading.Event()
+        self.writes.put(committed)
+        committed.wait()
+    
+    def close(self):
+        if self.writer.is_alive():
+            self.writes.put(None)
+            self.writer.join()
+        self.conn.close()
+
+class ResultSink:
+    """Append-only NDJSON stream with one compact record per completed result.
+
+    Paths ending in ``.gz`` (or ``compress=True``) are gzip-compressed. The
+    stream is flushed and synced to disk at most every ``flush_interval``
+    seconds, and no later than that after a write (by a timer on the running
+    event loop, even if no further records arrive), so it doubles as the
+    checkpoint of a bulk scan: a crash loses little more than the last
+    interval, and ``append=True`` carries on an existing stream after
+    ``recover_stream``.
+    """
+
+    def __init__(self, path: str, compress: bool = False, flush_interval: float = 1.0, append: bool = False):
+        if compress and not path.endswith('.gz'):
+            path = f"{path}.gz"
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.flush_interval = flush_interval
+        self.records = 0
+        self.last_flush = time.monotonic()
+        self.timer: Optional[asyncio.TimerHandle] = None
+        opener = gzip.open if path.endswith('.gz') else open
+        self.handle = opener(path, 'at' if append else 'wt', encoding='utf-8')
+    
+    @staticmethod
+    def encode(record_type: str, record: Dict[str, Any]) -> str:
+        return json.dumps({'type': record_type, **record}, ensure_ascii=False, separators=(',', ':')) + '\n'
+    
+    def write(self, record_type: str, record: Dict[str, Any]):
+        self.write_encoded(self.encode(record_type, record))
+    
+    def write_encoded(self, *lines: str):
+        """Append records already serialized by ``encode``, e.g. in another process."""
+        self.handle.writelines(lines)
+        self.records += len(lines)
+        due = self.last_flush + self.flush_interval - time.monotonic()
+        if due <= 0:
+            self.flush()
+        elif self.timer is None:
+            try:
+                self.timer = asyncio.get_running_loop().call_later(due, self.flush)
+            except RuntimeError:
+                pass  # no event loop; the next write or close() flushes
+    
+    def flush(self):
+        """Flush and sync everything written so far to disk."""
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+        if self.handle.closed:
+            return
+        self.handle.flush()
+        os.fsync(self.handle.fileno())
+        self.last_flush = time.monotonic()
+    
+    def close(self):
+        if self.timer:
+            self.timer.cancel()
+            self.timer = None
+        if not self.handle.closed:
+            self.handle.close()
+
+def recover_stream(path: str) -> Tuple[set, Dict[str, Dict[str, Dict[str, Any]]]]:
+    """Read back the result stream of an interrupted bulk scan so it can be resumed.
+
+    Returns the usernames whose scan completed and, for targets that were
+    cut off, the checks already recorded for them. A record torn by the
+    crash is cut off the end of the file (gzip streams are rewritten up to
+    it) so new records can be appended cleanly.
+    """
+    completed = set()
+    unfinished = {}
+    compressed = path.endswith('.gz')
+    intact = 0
+    
+    def apply(record: Dict[str, Any]):
+        record_type = record.pop('type', None)
+        username = record.pop('username', None)
+        if username is None:
+            return
+        if record_type == 'check':
+            unfinished.setdefault(username, {})[record['platform']] = record
+        elif record_type == 'scan_complete':
+            unfinished.pop(username, None)
+            completed.add(username)
+    
+    copy = gzip.open(f"{path}.tmp", 'wb') if compressed else None
+    try:
+        with (gzip.open(path, 'rb') if compressed else open(path, 'rb')) as f:
+            try:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    apply(record)
+                    intact += len(line)
+                    if copy:
+                        copy.write(line)
+            except (EOFError, OSError):
+                logging.warning(f"{path} ends in a truncated gzip block; keeping the records before it")
+    finally:
+        if copy:
+            copy.close()
+    
+    if compressed:
+        os.replace(f"{path}.tmp", path)
+    else:
+        os.truncate(path, intact)
+    return completed, unfinished
+
+def read_stream(path: str) -> Iterator[Dict[str, Any]]:
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                logging.warning("Skipping truncated record in %s", path)
+
+def scan_statistics(results: Dict[str, Dict[str, Any]], total_platforms: int) -> Dict[str, Any]:
+    found_count = sum(1 for result in results.values() if result.get('status') == 'found')
+    error_count = sum(1 for result in results.values() if result.get('status') == 'error')
+    expired_count = sum(1 for result in results.values() if result.get('status') == 'deadline_exceeded')
+    invalid_count = sum(1 for result in results.values() if result.get('status') == 'invalid_username')
+    return {
+        'total_platforms': total_platforms,
+        'found': found_count,
+        'not_found': len(results) - found_count - error_count - expired_count - invalid_count,
+        'errors': error_count,
+        'deadline_exceeded': expired_count,
+        'invalid_username': invalid_count,
+        'success_rate': (found_count / len(results)) * 100 if results else 0
+    }
+
+def write_report(results: Dict[str, Any], username: str, output_dir: str = "reports") -> str:
+    Path(output_dir).mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"{output_dir}/osint_{username}_{timestamp}.json"
+    
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    
+    logging.info("%s📁 Results saved to: %s%s", Colors.GREEN, filename, Colors.END)
+    return filename
+
+def build_reports(stream_path: str, output_dir: str = "reports") -> List[str]:
+    """Rebuild the pretty per-username JSON reports from a result stream.
+
+    A username's records are released as soon as its ``scan_complete`` record
+    is read, so memory is bounded by the targets that were in flight. Targets
+    cut off by a crash still get a report from whatever checks were recorded.
+    """
+    open_scans = {}
+    filenames = []
+    
+    def finish(username: str, complete: Optional[Dict[str, Any]] = None):
+        scan = open_scans.pop(username)
+        checks = scan['checks']
+        total = complete.get('total_platforms', len(checks)) if complete else len(checks)
+        results = {
+            'muscle_scan': {
+                'username': username,
+                'platform_results': checks,
+                'statistics': scan_statistics(checks, total),
+                'timestamp': complete['timestamp'] if complete else datetime.now().isoformat()
+            },
+            'timestamp': complete['timestamp'] if complete else datetime.now().isoformat()
+        }
+        if scan['brain']:
+            results = {'brain_analyze': scan['brain'], **results}
+        filenames.append(write_report(results, username, output_dir))
+    
+    for record in read_stream(stream_path):
+        record_type = record.pop('type', None)
+        username = record.get('username')
+        if username is None or record_type not in ('check', 'brain', 'scan_complete'):
+            continue
+        
+        scan = open_scans.setdefault(username, {'brain': None, 'checks': {}})
+        if record_type == 'check':
+            record.pop('username')
+            scan['checks'][record['platform']] = record
+        elif record_type == 'brain':
+            scan['brain'] = record
+        else:
+            finish(username, record)
+    
+    for username in list(open_scans):
+        finish(username)
+    return filenames
+
+GENERIC_MARKERS = ('admin', 'test', 'user', 'demo')
+ASCII_DIGITS = b'0123456789'
+ASCII_UPPER = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+ASCII_ALNUM = ASCII_DIGITS + ASCII_UPPER + ASCII_UPPER.lower()
+
+def character_counts(username: str) -> Tuple[int, int, int]:
+    """(alphanumeric, digit, uppercase) counts, as str.isalnum/isdigit/isupper see them.
+
+    ASCII names, nearly all of them, are counted with bytes.translate instead
+    of a Python-level loop over the characters.
+    """
+    if username.isascii():
+        raw = username.encode('ascii')
+        size = len(raw)
+        return (
+            size - len(raw.translate(None, ASCII_ALNUM)),
+            size - len(raw.translate(None, ASCII_DIGITS)),
+            size - len(raw.translate(None, ASCII_UPPER))
+        )
+    return sum(map(str.isalnum, username)), sum(map(str.isdigit, username)), sum(map(str.isupper, username))
+
+def brain_confidence(username: str) -> float:
+    """Stable stand-in for the old random confidence: same 0.75-0.98 range, derived from the name."""
+    return 0.75 + 0.23 * zlib.crc32(username.encode('utf-8')) / 0xFFFFFFFF
+
+def brain_analyze_batch(usernames: Iterable[str], chunk_size: int = 1024) -> Iterator[Dict[str, Any]]:
+    """Brain analysis of many usernames, yielded lazily in input order.
+
+    Works a chunk at a time: the per-name columns (lengths, character class
+    counts, lowercase forms) are built for the whole chunk in single passes,
+    then each record is assembled from them. Records match what
+    ``EnhancedOSINTSystem.brain_analyze`` returns for the same name.
+    """
+    iterator = iter(usernames)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        
+        timestamp = datetime.now().isoformat()
+        lengths = list(map(len, chunk))
+        counts = list(map(character_counts, chunk))
+        lowered = list(map(str.lower, chunk))
+        
+        for username, length, (alnum_count, digit_count, upper_count), lower in zip(chunk, lengths, counts, lowered):
+            special_chars = length - alnum_count
+            numeric_heavy = digit_count > length / 2
+            features = {
+                'length': length,
+                'has_digits': digit_count > 0,
+                'has_underscore': '_' in username,
+                'has_dot': '.' in username,
+                'has_dash': '-' in username,
+                'alphanumeric_ratio': alnum_count / length if username else 0,
+                'special_chars': special_chars,
+                'uppercase_count': upper_count,
+                'digit_count': digit_count,
+            }
+            
+            patterns = []
+            if any(marker in lower for marker in GENERIC_MARKERS):
+                patterns.append("generic")
+            if length < 4:
+                patterns.append("short")
+            if numeric_heavy:
+                patterns.append("numeric_heavy")
+            if lower == username and '_' not in username:
+                patterns.append("simple_lowercase")
+            
+            pattern_type = patterns[0] if patterns else "custom"
+            
+            risk_factors = {
+                'common_pattern': pattern_type == "generic",
+                'short_username': length < 5,
+                'suspicious_chars': special_chars > 3,
+                'numeric_heavy': numeric_heavy
+            }
+            
+            risk_score = sum(risk_factors.values()) / len(risk_factors)
+            
+            yield {
+                'username': username,
+                'pattern_type': pattern_type,
+                'patterns_detected': patterns,
+                'features': features,
+                'risk_assessment': {
+                    'score': risk_score,
+                    'factors': risk_factors,
+                    'level': 'high' if risk_score > 0.6 else 'medium' if risk_score > 0.3 else 'low'
+                },
+                'confidence': brain_confidence(username),
+                'timestamp': timestamp
+            }
+
+async def read_prefix(stream: aiohttp.StreamReader, limit: int) -> bytes:
+    """Read up to ``limit`` bytes of a response body, stopping early at EOF."""
+    body = bytearray()
+    while len(body) < limit:
+        chunk = await stream.read(limit - len(body))
+        if not chunk:
+            break
+        body += chunk
+    return bytes(body)
 
 class EnhancedOSINTSystem:
-    def __init__(self, proxy_config: Optional[ProxyConfig] = None):
+    def __init__(
+        self,
+        proxy_config: Optional[ProxyConfig] = None,
+        max_concurrency: int = 10,
+        per_host_limit: int = 2,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        dns_analyzer: Optional[DNSAnalyzer] = None,
+        result_cache: Optional[ResultCache] = None,
+        history: Optional[FindingsStore] = None,
+        deadline: Optional[float] = None,
+        hedge: bool = False,
+        platform_rules: Optional[Dict[str, PlatformRule]] = None,
+        metrics: Optional[ScanMetrics] = None
+    ):
         self.session = None
-        self.rate_limiter = RateLimiter(max_requests=10, time_window=60)
-        self.dns_analyzer = DNSAnalyzer()
+        self.metrics = metrics or ScanMetrics()
+        self.trace_config = self.metrics.trace_config()
+        self.rate_limiter = rate_limiter or RateLimiter(max_requests=10, time_window=60)
+        self.concurrency = concurrency or AdaptiveConcurrency(initial=per_host_limit)
+        self.scheduler = ScanScheduler(
+            max_concurrency=max_concurrency,
+            per_host_limit=per_host_limit,
+            controller=self.concurrency,
+            retry_budget=retry_budget
+        )
+        self.max_retries = 3
+        self.deadline = deadline
+        self.hedge = hedge
+        self.probe_latencies = LatencyTracker()
+        self.hedges_fired = 0
+        self.dns_analyzer = dns_analyzer or DNSAnalyzer()
+        self.result_cache = result_cache
+        self.history = history
         self.proxy_config = proxy_config or ProxyConfig()
-        self.current_proxy_index = 0
-        
-        # Platform list
-        self.platforms = {
-            'github': 'https://github.com/{}',
-            'twitter': 'https://twitter.com/{}',
-            'instagram': 'https://instagram.com/{}',
-            'facebook': 'https://facebook.com/{}',
-            'linkedin': 'https://linkedin.com/in/{}',
-            'reddit': 'https://reddit.com/user/{}',
-            'pinterest': 'https://pinterest.com/{}',
-            'tumblr': 'https://{}.tumblr.com',
-            'medium': 'https://medium.com/@{}',
-            'dev.to': 'https://dev.to/{}',
-            'stackoverflow': 'https://stackoverflow.com/users/{}',
-            'hackernews': 'https://news.ycombinator.com/user?id={}',
-            'producthunt': 'https://www.producthunt.com/@{}',
-            'behance': 'https://www.behance.net/{}',
-            'dribbble': 'https://dribbble.com/{}',
-            'twitch': 'https://www.twitch.tv/{}',
-            'steam': 'https://steamcommunity.com/id/{}',
-            'youtube': 'https://www.youtube.com/@{}',
-            'tiktok': 'https://www.tiktok.com/@{}',
-            'spotify': 'https://open.spotify.com/user/{}',
-            'soundcloud': 'https://soundcloud.com/{}',
-            'flickr': 'https://www.flickr.com/people/{}',
-            'gitlab': 'https://gitlab.com/{}',
-            'bitbucket': 'https://bitbucket.org/{}',
-            'quora': 'https://www.quora.com/profile/{}',
-            'aboutme': 'https://about.me/{}',
-            'etsy': 'https://www.etsy.com/shop/{}',
-            'ebay': 'https://www.ebay.com/usr/{}',
-            'goodreads': 'https://www.goodreads.com/user/show/{}',
-        }
+        self.proxy_pool = None
+        if self.proxy_config.rotation_enabled and self.proxy_config.proxy_list:
+            self.proxy_pool = ProxyPool(self.proxy_config.proxy_list, trace_configs=[self.trace_config])
+        self.proxy_check_url = 'https://www.gstatic.com/generate_204'
+        
+        # Platforms, their username rules and how each is probed come from
+        # the registry file; anything without a rule gets a ranged GET that
+        # follows up to three redirects and never reads the body.
+        self.platform_rules = platform_rules if platform_rules is not None else load_platforms()
+        self.platforms = {name: rule.url for name, rule in self.platform_rules.items()}
+        self.default_probe = ProbeStrategy()
+        self.probes = {name: rule.probe for name, rule in self.platform_rules.items()}
     
     async def initialize(self):
+        if self.session and not self.session.closed:
+            return
         self.session = aiohttp.ClientSession(
             timeout=aiohttp.ClientTimeout(total=15),
-            connector=aiohttp.TCPConnector(ssl=False, limit=100)
+            connector=aiohttp.TCPConnector(ssl=False, limit=max(100, self.scheduler.max_concurrency)),
+            trace_configs=[self.trace_config]
         )
+        if self.proxy_pool:
+            await self.proxy_pool.health_check(self.proxy_check_url)
+    
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+        if self.proxy_pool:
+            await self.proxy_pool.close()
+        if self.result_cache:
+            self.result_cache.flush()
+        if self.history:
+            self.history.flush()
+    
+    @staticmethod
+    def rate_key(url: str, proxy: Optional[str] = None) -> str:
+        host = urlparse(url).hostname or url
+        if proxy:
+            return f"{host} via {proxy_label(proxy)}"
+        return host
     
     def get_proxy(self) -> Optional[str]:
-        if not self.proxy_config.rotation_enabled or not self.proxy_config.proxy_list:
-            return self.proxy_config.http_proxy
-        
-        proxy = self.proxy_config.proxy_list[self.current_proxy_index]
-        self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxy_config.proxy_list)
-        return proxy
+        if self.proxy_pool:
+            return self.proxy_pool.select()
+        return self.proxy_config.http_proxy
+    
+    def session_for(self, proxy: Optional[str]) -> aiohttp.ClientSession:
+        if proxy and self.proxy_pool:
+            return self.proxy_pool.session_for(proxy)
+        return self.session
     
     async def brain_analyze(self, username: str) -> Dict[str, Any]:
-        logging.info(f"{Colors.PINK}🧠 Brain analyzing: {username}{Colors.END}")
-        await asyncio.sleep(0.3)
-        
-        features = {
-            'length': len(username),
-            'has_digits': any(c.isdigit() for c in username),
-            'has_underscore': '_' in username,
-            'has_dot': '.' in username,
-            'has_dash': '-' in username,
-            'alphanumeric_ratio': sum(c.isalnum() for c in username) / len(username) if username else 0,
-            'special_chars': len([c for c in username if not c.isalnum()]),
-            'uppercase_count': sum(c.isupper() for c in username),
-            'digit_count': sum(c.isdigit() for c in username),
-        }
+        logging.info("%s🧠 Brain analyzing: %s%s", Colors.PINK, username, Colors.END)
+        return next(brain_analyze_batch([username]))
+    
+    def platform_jobs(self, username: str) -> List[ScanJob]:
+        deadline = None
+        if self.deadline is not None:
+            deadline = asyncio.get_running_loop().time() + self.deadline
         
-        patterns = []
-        if any(x in username.lower() for x in ['admin', 'test', 'user', 'demo']):
-            patterns.append("generic")
-        if len(username) < 4:
-            patterns.append("short")
-        if features['digit_count'] > len(username) / 2:
-            patterns.append("numeric_heavy")
-        if username.lower() == username and '_' not in username:
-            patterns.append("simple_lowercase")
-        
-        pattern_type = patterns[0] if patterns else "custom"
-        
-        risk_factors = {
-            'common_pattern': pattern_type == "generic",
-            'short_username': len(username) < 5,
-            'suspicious_chars': features['special_chars'] > 3,
-            'numeric_heavy': features['digit_count'] > len(username) / 2
+        jobs = []
+        for platform, url_template in self.platforms.items():
+            rule = self.platform_rules.get(platform)
+            if rule and not rule.accepts(username):
+                continue
+            url = url_template.format(username)
+            jobs.append(ScanJob(
+                key=platform,
+                host=urlparse(url).hostname or platform,
+                factory=partial(self.check_platform, platform, url, username),
+                deadline=deadline
+            ))
+        return jobs
+    
+    def rejected_checks(self, username: str) -> Dict[str, Dict[str, Any]]:
+        """Results for platforms whose username rules rule this name out; no request is made."""
+        rejected = {
+            platform: {'status': 'invalid_username', 'platform': platform}
+            for platform in self.platforms
+            if platform in self.platform_rules and not self.platform_rules[platform].accepts(username)
         }
+        for platform in rejected:
+            self.metrics.inc('checks_total', platform=platform, status='invalid_username')
+        return rejected
+    
+    async def check_platform(
+        self,
+        platform: str,
+        url: str,
+        username: str,
+        attempt: int = 0
+    ) -> Union[Dict[str, Any], Retry]:
+        if self.result_cache and attempt == 0:
+            cached = self.result_cache.get(platform, username)
+            if cached is not None:
+                return {**cached, 'cached': True}
+        
+        result = await self.check_platform_attempt(platform, url, username, attempt, self.max_retries)
+        if isinstance(result, Retry):
+            self.metrics.inc('retries_total', platform=platform, reason=result.result.get('status', 'error'))
+            result.factory = partial(self.check_platform, platform, url, username, attempt + 1)
+            return result
+        if self.result_cache:
+            self.result_cache.put(platform, username, result)
+        return result
+    
+    def _check_result(self, platform: str, result: Any) -> Dict[str, Any]:
+        if isinstance(result, DeadlineExceeded):
+            result = {
+                'status': 'deadline_exceeded',
+                'platform': platform
+            }
+        elif isinstance(result, Exception):
+            result = {
+                'status': 'error',
+                'error': str(result),
+                'platform': platform
+            }
+        self.metrics.inc('checks_total', platform=platform, status=result.get('status', 'error'))
+        return result
+    
+    async def iter_platform_checks(self, username: str) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        for platform, result in self.rejected_checks(username).items():
+            yield platform, result
+        async for platform, result in self.scheduler.map(self.platform_jobs(username)):
+            yield platform, self._check_result(platform, result)
+    
+    async def muscle_scan(
+        self,
+        username: str,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        logging.info("%s💪 Muscle scanning across %d platforms%s", Colors.CYAN, len(self.platforms), Colors.END)
         
-        risk_score = sum(risk_factors.values()) / len(risk_factors)
+        results = {}
         
-        return {
+        async for platform, result in self.iter_platform_checks(username):
+            results[platform] = result
+            if on_result:
+                on_result(platform, result)
+        
+        return self._summarize_scan(username, results)
+    
+    def _summarize_scan(self, username: str, results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        results = {platform: results[platform] for platform in self.platforms if platform in results}
+        scan = {
             'username': username,
-            'pattern_type': pattern_type,
-            'patterns_detected': patterns,
-            'features': features,
-            'risk_assessment': {
-                'score': risk_score,
-                'factors': risk_factors,
-                'level': 'high' if risk_score > 0.6 else 'medium' if risk_score > 0.3 else 'low'
-            },
-            'confidence': random.uniform(0.75, 0.98),
+            'platform_results': results,
+            'statistics': scan_statistics(results, len(self.platforms)),
             'timestamp': datetime.now().isoformat()
         }
+        if self.history:
+            self.history.record_scan(scan)
+        return scan
     
-    async def muscle_scan(self, username: str) -> Dict[str, Any]:
-        logging.info(f"{Colors.CYAN}💪 Muscle scanning across {len(self.platforms)} platforms{Colors.END}")
-        
-        results = {}
-        found_count = 0
-        error_count = 0
+    async def bulk_scan(
+        self,
+        usernames: Union[Iterable[str], AsyncIterable[str]],
+        on_complete: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_result: Optional[Callable[[str, str, Dict[str, Any]], None]] = None,
+        resume: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+    ) -> Dict[str, Any]:
+        """Scan every (username, platform) pair through one session and scheduler.
+
+        ``on_result`` receives each check as it finishes; ``on_complete``
+        receives a muscle_scan-shaped result as soon as all platforms for a
+        username have finished. ``resume`` maps usernames to checks already
+        made by an interrupted run; those pairs are not checked again, and
+        entries are popped as their targets come up.
+        """
+        logging.info("%s💪 Bulk scanning across %d platforms%s", Colors.CYAN, len(self.platforms), Colors.END)
         
-        batch_size = 5
-        platform_items = list(self.platforms.items())
+        pending = {}
+        totals = {'targets': 0, 'checks': 0, 'found': 0}
         
-        for i in range(0, len(platform_items), batch_size):
-            batch = platform_items[i:i + batch_size]
-            tasks = []
-            
-            for platform, url_template in batch:
-                task = self.check_platform_with_retry(
-                    platform,
-                    url_template.format(username),
-                    username
-                )
-                tasks.append(task)
-            
-            batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for (platform, _), result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    results[platform] = {
-                        'status': 'error',
-                        'error': str(result),
-                        'platform': platform
-                    }
-                    error_count += 1
-                else:
-                    results[platform] = result
-                    if result.get('status') == 'found':
-                        found_count += 1
+        def record(username: str, platform: str, result: Dict[str, Any]):
+            totals['checks'] += 1
+            if result.get('status') == 'found':
+                totals['found'] += 1
+            if on_result:
+                on_result(username, platform, result)
             
-            if i + batch_size < len(platform_items):
-                await asyncio.sleep(0.5)
+            pending[username][platform] = result
+            finish(username)
+        
+        def finish(username: str):
+            bucket = pending[username]
+            if len(bucket) == len(self.platforms):
+                del pending[username]
+                totals['targets'] += 1
+                scan = self._summarize_scan(username, bucket) if on_complete or self.history else None
+                if on_complete:
+                    on_complete(scan)
+        
+        async def jobs() -> AsyncIterator[ScanJob]:
+            async for username in aiterate(usernames):
+                if username in pending:
+                    continue
+                done = resume.pop(username, None) if resume else None
+                bucket = pending[username] = dict(done) if done else {}
+                for platform, result in self.rejected_checks(username).items():
+                    if platform not in bucket:
+                        record(username, platform, result)
+                if done and username in pending:
+                    finish(username)
+                if username not in pending:
+                    continue
+                for job in self.platform_jobs(username):
+                    if job.key in bucket:
+                        continue
+                    yield ScanJob(key=(username, job.key), host=job.host, factory=job.factory, deadline=job.deadline)
+        
+        await self.initialize()
+        started = time.perf_counter()
+        
+        async for (username, platform), result in self.scheduler.map(jobs()):
+            record(username, platform, self._check_result(platform, result))
         
+        elapsed = time.perf_counter() - started
         return {
-            'username': username,
-            'platform_results': results,
-            'statistics': {
-                'total_platforms': len(self.platforms),
-                'found': found_count,
-                'not_found': len(results) - found_count - error_count,
-                'errors': error_count,
-                'success_rate': (found_count / len(results)) * 100 if results else 0
-            },
+            **totals,
+            'elapsed_seconds': elapsed,
+            'checks_per_second': totals['checks'] / elapsed if elapsed > 0 else 0.0,
             'timestamp': datetime.now().isoformat()
         }
     
-    async def check_platform_with_retry(
+    async def probe(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        proxy: Optional[str],
+        strategy: ProbeStrategy
+    ) -> ProbeResult:
+        """Fetch just enough of ``url`` to decide whether the profile exists.
+
+        HEAD falls back to GET when the site rejects it. GETs ask for a byte
+        range and read at most ``body_bytes`` of the body for signature
+        matching. The rest is only drained when small enough to keep the
+        connection reusable; anything larger is aborted unread.
+        """
+        method = strategy.method
+        while True:
+            request_headers = headers
+            if method == 'GET':
+                request_headers = {**headers, 'Range': f"bytes=0-{max(strategy.body_bytes, 1) - 1}"}
+            
+            async with self.session_for(proxy).request(
+                method,
+                url,
+                headers=request_headers,
+                proxy=proxy,
+                allow_redirects=strategy.follow_redirects,
+                max_redirects=strategy.max_redirects,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if method == 'HEAD' and response.status in (405, 501):
+                    method = 'GET'
+                    continue
+                
+                final_url = str(response.url)
+                if not strategy.follow_redirects and 300 <= response.status < 400:
+                    final_url = urljoin(final_url, response.headers.get('Location', ''))
+                
+                body = b''
+                if method == 'GET':
+                    if strategy.body_bytes:
+                        body = await read_prefix(response.content, strategy.body_bytes)
+                    if not response.content.at_eof():
+                        # Drain small bodies so the connection can be reused; drop big ones
+                        if response.content_length is not None and response.content_length <= 65536:
+                            await response.read()
+                        else:
+                            response.close()
+                return ProbeResult(
+                    status=response.status,
+                    final_url=final_url,
+                    retry_after=parse_retry_after(response.headers.get('Retry-After')),
+                    body=body
+                )
+    
+    async def hedged_probe(
+        self,
+        platform: str,
+        url: str,
+        headers: Dict[str, str],
+        proxy: Optional[str],
+        strategy: ProbeStrategy
+    ) -> ProbeResult:
+        """Probe, firing a second request if the first outlives the platform's p95.
+
+        The hedge goes out on another pooled connection (and the next proxy
+        when rotating) if the rate limiter has a slot free for it right away;
+        whichever answers first wins and the other is cancelled. The result's
+        ``proxy`` is the one that answered. Probes started before there are
+        enough latencies for a p95 keep checking for one while they run.
+        """
+        if not self.hedge:
+            return replace(await self.probe(url, headers, proxy, strategy), proxy=proxy)
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        primary = asyncio.ensure_future(self.probe(url, headers, proxy, strategy))
+        pending = {primary}
+        proxies = {primary: proxy}
+        first_error = None
+        try:
+            hedge_after = self.probe_latencies.percentile(platform)
+            while hedge_after is None:
+                done, _ = await asyncio.wait(pending, timeout=HEDGE_POLL_INTERVAL)
+                if done:
+                    return replace(primary.result(), proxy=proxy)
+                hedge_after = self.probe_latencies.percentile(platform)
+            
+            done, _ = await asyncio.wait(pending, timeout=max(0.0, started + hedge_after - loop.time()))
+            if done:
+                return replace(primary.result(), proxy=proxy)
+            
+            hedge_proxy = self.get_proxy() if self.proxy_config.enabled else None
+            if self.rate_limiter.try_acquire(self.rate_key(url, hedge_proxy), platform):
+                self.hedges_fired += 1
+                hedge = asyncio.ensure_future(self.probe(url, headers, hedge_proxy, strategy))
+                pending.add(hedge)
+                proxies[hedge] = hedge_proxy
+            else:
+                self.metrics.inc('hedges_skipped_total', platform=platform)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if primary.done() and task is not primary:
+                            self._record_hedge_failure(primary, proxy)
+                        return replace(task.result(), proxy=proxies[task])
+                    if task is not primary:
+                        self._record_hedge_failure(task, proxies[task])
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _record_hedge_failure(self, task: asyncio.Future, proxy: Optional[str]):
+        """Charge a failed probe to its proxy when the caller won't see the error."""
+        if proxy and self.proxy_pool and isinstance(
+            task.exception(), (asyncio.TimeoutError, aiohttp.ClientConnectionError)
+        ):
+            self.proxy_pool.record_failure(proxy)
+    
+    async def check_platform_attempt(
         self,
         platform: str,
         url: str,
         username: str,
+        attempt: int = 0,
         max_retries: int = 3
-    ) -> Dict[str, Any]:
-        for attempt in range(max_retries):
+    ) -> Union[Dict[str, Any], Retry]:
+        """Make one attempt; failures that may be retried come back as ``Retry``."""
+        host = urlparse(url).hostname or url
+        can_retry = attempt < max_retries - 1
+        proxy = None
+        try:
+            proxy = self.get_proxy() if self.proxy_config.enabled else None
+            waited = time.monotonic()
+            await self.rate_limiter.acquire(self.rate_key(url, proxy), platform)
+            self.metrics.inc('rate_limit_wait_seconds_total', time.monotonic() - waited, platform=platform)
+            
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1'
+            }
+            
+            strategy = self.probes.get(platform, self.default_probe)
+            started = time.monotonic()
             try:
-                await self.rate_limiter.acquire(platform)
-                proxy = self.get_proxy() if self.proxy_config.enabled else None
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1'
+                outcome = await self.hedged_probe(platform, url, headers, proxy, strategy)
+            finally:
+                latency = time.monotonic() - started
+                self.metrics.inc('network_seconds_total', latency, platform=platform)
+            status, final_url = outcome.status, outcome.final_url
+            self.metrics.observe('platform_request_seconds', latency, platform=platform)
+            self.metrics.observe('host_request_seconds', latency, host=host)
+            self.metrics.inc('responses_total', platform=platform, code=str(status))
+            if outcome.proxy and self.proxy_pool:
+                if status == 407:
+                    self.proxy_pool.record_failure(outcome.proxy)
+                    raise aiohttp.ClientError("Proxy authentication required")
+                self.proxy_pool.record_success(outcome.proxy, latency)
+            
+            if status in (429, 503):
+                self.concurrency.record_throttle(host, outcome.retry_after)
+                result = {
+                    'status': 'throttled',
+                    'status_code': status,
+                    'url': final_url,
+                    'platform': platform,
+                    'attempts': attempt + 1
                 }
+                if can_retry:
+                    return Retry(delay=max(self.concurrency.delay(host), 2 ** attempt), result=result)
+                return result
+            self.concurrency.record_success(host, latency)
+            self.probe_latencies.record(platform, latency)
+            
+            rule = self.platform_rules.get(platform)
+            if rule:
+                found = rule.is_found(status, url, final_url, outcome.body)
+            else:
+                found = status in (200, 206)
+            
+            return {
+                'status': 'found' if found else 'not_found',
+                'status_code': status,
+                'url': final_url,
+                'platform': platform,
+                'attempt': attempt + 1
+            }
+        
+        except aiohttp.TooManyRedirects as error:
+            return {
+                'status': 'not_found',
+                'status_code': error.history[-1].status if error.history else None,
+                'url': url,
+                'platform': platform,
+                'error': 'Too many redirects',
+                'attempt': attempt + 1
+            }
                 
-                async with self.session.get(
-                    url,
-                    headers=headers,
-                    proxy=proxy,
-                    allow_redirects=True,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    
-                    status = response.status
-                    final_url = str(response.url)
-                    
-                    found = False
-                    if status == 200:
-                        if platform == 'github' and '/search?' not in final_url:
-                            found = True
-                        elif platform == 'instagram' and final_url == url:
-                            found = True
-                        elif platform not in ['github', 'instagram']:
-                            found = True
-                    
-                    return {
-                        'status': 'found' if found else 'not_found',
-                        'status_code': status,
-                        'url': final_url,
-                        'platform': platform,
-                        'attempt': attempt + 1
-                    }
-                    
-            except asyncio.TimeoutError:
-                if attempt == max_retries - 1:
-                    return {
-                        'status': 'timeout',
-                        'platform': platform,
-                        'error': 'Request timeout',
-                        'attempts': attempt + 1
-                    }
-                await asyncio.sleep(2 ** attempt)
-                
-            except Exception as error:
-                if attempt == max_retries - 1:
-                    return {
-                        'status': 'error',
-                        'platform': platform,
-                        'error': str(error),
-                        'attempts': attempt + 1
-                    }
-                await asyncio.sleep(2 ** attempt)
-        
-        return {'status': 'failed', 'platform': platform}
-    
-    async def full_osint_scan(self, username: str) -> Dict[str, Any]:
+        except asyncio.TimeoutError:
+            self.metrics.inc('timeouts_total', platform=platform)
+            self.concurrency.record_throttle(host)
+            if proxy and self.proxy_pool:
+                self.proxy_pool.record_failure(proxy)
+            result = {
+                'status': 'timeout',
+                'platform': platform,
+                'error': 'Request timeout',
+                'attempts': attempt + 1
+            }
+            
+        except Exception as error:
+            if proxy and self.proxy_pool and isinstance(error, aiohttp.ClientConnectionError):
+                self.proxy_pool.record_failure(proxy)
+            result = {
+                'status': 'error',
+                'platform': platform,
+                'error': str(error),
+                'attempts': attempt + 1
+            }
+        
+        if can_retry:
+            return Retry(delay=2 ** attempt, result=result)
+        return result
+    
+    async def full_osint_scan(self, username: str, sink: Optional[ResultSink] = None) -> Dict[str, Any]:
         display_banner()
-        logging.info(f"{Colors.BOLD}{Colors.PINK}🔥 Starting OSINT scan for: {username}{Colors.END}")
+        logging.info("%s%s🔥 Starting OSINT scan for: %s%s", Colors.BOLD, Colors.PINK, username, Colors.END)
+        
+        def stream_check(platform: str, result: Dict[str, Any]):
+            sink.write('check', {'username': username, **result})
         
         try:
             await self.initialize()
             
             brain_results = await self.brain_analyze(username)
-            muscle_results = await self.muscle_scan(username)
+            if sink:
+                sink.write('brain', brain_results)
+            muscle_results = await self.muscle_scan(username, on_result=stream_check if sink else None)
+            if sink:
+                sink.write('scan_complete', {
+                    'username': username,
+                    'total_platforms': muscle_results['statistics']['total_platforms'],
+                    'timestamp': muscle_results['timestamp']
+                })
             
             all_results = {
                 'brain_analyze': brain_results,
@@ -409,23 +2403,32 @@ class EnhancedOSINTSystem:
             return all_results
             
         except Exception as error:
-            logging.error(f"OSINT scan failed: {error}")
+            logging.error("OSINT scan failed: %s", error)
             return {'error': str(error)}
         
         finally:
-            if self.session:
-                await self.session.close()
+            await self.close()
 
+    def collect_metrics(self) -> ScanMetrics:
+        """The metrics, with gauges refreshed from the caches, retry budget and proxy pool."""
+        budget = self.scheduler.retry_budget
+        self.metrics.set('retry_budget_spent', budget.spent)
+        self.metrics.set('retry_budget_refused', budget.refused)
+        self.metrics.set('hedges_fired', self.hedges_fired)
+        if self.result_cache:
+            cache_stats = self.result_cache.stats()
+            self.metrics.set('result_cache_lookups', cache_stats['hits'], result='hit')
+            self.metrics.set('result_cache_lookups', cache_stats['misses'], result='miss')
+        dns_stats = self.dns_analyzer.cache.stats()
+        self.metrics.set('dns_answer_cache_lookups', dns_stats['hits'], result='hit')
+        self.metrics.set('dns_answer_cache_lookups', dns_stats['misses'], result='miss')
+        if self.proxy_pool:
+            for proxy in self.proxy_pool.stats():
+                self.metrics.set('proxy_healthy', 0 if proxy.get('quarantined') else 1, proxy=proxy['proxy'])
+        return self.metrics
+    
     def save_results(self, results: Dict[str, Any], username: str, output_dir: str = "reports"):
-        Path(output_dir).mkdir(exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{output_dir}/osint_{username}_{timestamp}.json"
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-        
-        logging.info(f"{Colors.GREEN}📁 Results saved to: {filename}{Colors.END}")
-        return filename
+        return write_report(results, username, output_dir)
 
     def print_summary(self, results: Dict[str, Any]):
         if 'error' in results:
@@ -443,6 +2446,10 @@ class EnhancedOSINTSystem:
         print(f"  Platforms Found: {Colors.GREEN}{stats.get('found', 0)}{Colors.END}")
         print(f"  Total Checked: {stats.get('total_platforms', 0)}")
         print(f"  Success Rate: {Colors.CYAN}{stats.get('success_rate', 0):.1f}%{Colors.END}")
+        if stats.get('deadline_exceeded'):
+            print(f"  Deadline Exceeded: {Colors.YELLOW}{stats['deadline_exceeded']}{Colors.END}")
+        if stats.get('invalid_username'):
+            print(f"  Skipped (invalid username): {stats['invalid_username']}")
         
         risk_level = brain.get('risk_assessment', {}).get('level', 'unknown')
         risk_color = Colors.RED if risk_level == 'high' else Colors.YELLOW if risk_level == 'medium' else Colors.GREEN
@@ -462,34 +2469,981 @@ class EnhancedOSINTSystem:
         
         print(f"{Colors.CYAN}{'='*50}{Colors.END}")
 
+def read_targets(path: str) -> Iterator[str]:
+    """Yield one target per non-empty line of a file, or of stdin for '-'."""
+    handle = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        for line in handle:
+            target = line.strip()
+            if target and not target.startswith('#'):
+                yield target
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+def stream_path(args: argparse.Namespace, name: str) -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{args.output_dir}/{name}_{timestamp}.ndjson{'.gz' if args.gzip else ''}"
+
+def open_bulk_sink(args: argparse.Namespace) -> Tuple[Optional[ResultSink], set, Dict[str, Dict[str, Dict[str, Any]]]]:
+    """Result stream for a bulk scan, plus what an interrupted run already recorded when resuming."""
+    if args.resume:
+        completed, unfinished = recover_stream(args.resume)
+        logging.info(f"{Colors.CYAN}↻ Resuming {args.resume}: {len(completed)} targets done, {len(unfinished)} partly done{Colors.END}")
+        return ResultSink(args.resume, flush_interval=args.flush_interval, append=True), completed, unfinished
+    if args.no_save:
+        return None, set(), {}
+    return ResultSink(stream_path(args, "bulk"), flush_interval=args.flush_interval), set(), {}
+
+async def run_bulk_scan(osint_system: EnhancedOSINTSystem, args: argparse.Namespace):
+    display_banner()
+    sink, completed, unfinished = open_bulk_sink(args)
+    summary = None
+    
+    def on_result(username: str, platform: str, result: Dict[str, Any]):
+        sink.write('check', {'username': username, **result})
+    
+    def on_complete(scan: Dict[str, Any]):
+        stats = scan['statistics']
+        logging.info("%s✓ %s: %d/%d found%s", Colors.GREEN, scan['username'], stats['found'], stats['total_platforms'], Colors.END)
+        if sink:
+            sink.write('scan_complete', {
+                'username': scan['username'],
+                'total_platforms': stats['total_platforms'],
+                'timestamp': scan['timestamp']
+            })
+    
+    try:
+        summary = await osint_system.bulk_scan(
+            (username for username in read_targets(args.input) if username not in completed),
+            on_complete=on_complete,
+            on_result=on_result if sink else None,
+            resume=unfinished
+        )
+    finally:
+        await osint_system.close()
+        if sink:
+            sink.close()
+            logging.info(f"{Colors.GREEN}📁 Results streamed to: {sink.path}{Colors.END}")
+            if summary is None:
+                logging.info(f"{Colors.YELLOW}Scan interrupted; continue it with --resume {sink.path}{Colors.END}")
+    
+    print_bulk_summary(summary, osint_system.result_cache.stats() if osint_system.result_cache else None)
+
+def print_bulk_summary(summary: Dict[str, Any], cache_stats: Optional[Dict[str, Any]] = None):
+    print(f"\n{Colors.BOLD}{Colors.PINK}🔥 HANDY REAPER - BULK SCAN{Colors.END}")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+    if summary.get('workers'):
+        print(f"  Worker Processes: {summary['workers']}")
+    print(f"  Targets Scanned: {summary['targets']}")
+    print(f"  Checks Completed: {summary['checks']}")
+    print(f"  Profiles Found: {Colors.GREEN}{summary['found']}{Colors.END}")
+    print(f"  Elapsed: {summary['elapsed_seconds']:.1f}s")
+    print(f"  Throughput: {Colors.CYAN}{summary['checks_per_second']:.1f} checks/s{Colors.END}")
+    if cache_stats:
+        print(f"  Cached Results Reused: {cache_stats['hits']} ({cache_stats['hit_rate']:.1f}%)")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+
+SHARD_CHUNK = 16
+
+async def shard_targets(tasks: Any) -> AsyncIterator[str]:
+    """Pull chunks of usernames off the shared task queue until the sentinel."""
+    loop = asyncio.get_running_loop()
+    while True:
+        chunk = await loop.run_in_executor(None, tasks.get)
+        if chunk is None:
+            return
+        for username in chunk:
+            yield username
+
+async def run_shard(
+    args: argparse.Namespace,
+    proxy_config: ProxyConfig,
+    platform_rules: Dict[str, PlatformRule],
+    unfinished: Dict[str, Dict[str, Dict[str, Any]]],
+    tasks: Any,
+    results: Any,
+    arrivals: Any
+) -> Dict[str, Any]:
+    osint_system = build_osint_system(args, build_rate_limiter(args, arrivals), proxy_config, platform_rules)
+    
+    def on_complete(scan: Dict[str, Any]):
+        # Records are serialized here so the parent only has to append them.
+        # Checks carried over from an interrupted run are already in the stream.
+        stats = scan['statistics']
+        lines = []
+        if not args.no_save or args.resume:
+            done = unfinished.get(scan['username'], {})
+            lines = [
+                ResultSink.encode('check', {'username': scan['username'], **result})
+                for platform, result in scan['platform_results'].items()
+                if platform not in done
+            ]
+            lines.append(ResultSink.encode('scan_complete', {
+                'username': scan['username'],
+                'total_platforms': stats['total_platforms'],
+                'timestamp': scan['timestamp']
+            }))
+        results.put(('scan', scan['username'], stats['found'], stats['total_platforms'], lines))
+    
+    try:
+        await osint_system.bulk_scan(shard_targets(tasks), on_complete=on_complete, resume=dict(unfinished))
+    finally:
+        await osint_system.close()
+        if osint_system.result_cache:
+            osint_system.result_cache.close()
+        if osint_system.history:
+            osint_system.history.close()
+    return {
+        'cache_stats': osint_system.result_cache.stats() if osint_system.result_cache else {},
+        'metrics': osint_system.collect_metrics()
+    }
+
+def shard_worker(
+    args: argparse.Namespace,
+    proxy_config: ProxyConfig,
+    platform_rules: Dict[str, PlatformRule],
+    unfinished: Dict[str, Dict[str, Dict[str, Any]]],
+    tasks: Any,
+    results: Any,
+    arrivals: Any
+):
+    """Entry point of a --workers process: one event loop, session and scheduler each."""
+    configure_logging(args.log_level, args.log_file)
+    report = {}
+    try:
+        report = asyncio.run(run_shard(args, proxy_config, platform_rules, unfinished, tasks, results, arrivals))
+    except KeyboardInterrupt:
+        pass
+    except Exception as error:
+        logging.error(f"Shard worker failed: {error}")
+    finally:
+        results.put(('done', report))
+
+async def run_sharded_scan(args: argparse.Namespace, proxy_config: ProxyConfig, platform_rules: Dict[str, PlatformRule]):
+    """Bulk scan sharded across worker processes.
+
+    Targets are handed out in small chunks from a bounded queue so fast
+    workers take more of them, every worker draws from one shared per-host
+    rate limit table, and their results are merged into a single stream.
+    """
+    display_banner()
+    logging.info(f"{Colors.CYAN}💪 Sharding targets across {args.workers} worker processes{Colors.END}")
+    
+    sink, completed, unfinished = open_bulk_sink(args)
+    context = multiprocessing.get_context('spawn')
+    tasks = context.Queue(maxsize=args.workers * 4)
+    results = context.Queue()
+    arrivals = SharedRateLimiter.create_table(context)
+    workers = [
+        context.Process(
+            target=shard_worker,
+            args=(args, proxy_config, platform_rules, unfinished, tasks, results, arrivals),
+            name=f"reaper-shard-{index}",
+            daemon=True
+        )
+        for index in range(args.workers)
+    ]
+    
+    def feed():
+        chunk = []
+        try:
+            for username in read_targets(args.input):
+                if username in completed:
+                    continue
+                chunk.append(username)
+                if len(chunk) >= SHARD_CHUNK:
+                    tasks.put(chunk)
+                    chunk = []
+            if chunk:
+                tasks.put(chunk)
+        except OSError as error:
+            logging.error(f"Cannot read targets: {error}")
+        finally:
+            for _ in workers:
+                tasks.put(None)
+    
+    totals = {'targets': 0, 'checks': 0, 'found': 0}
+    cache_stats = {'hits': 0, 'misses': 0}
+    metrics = ScanMetrics()
+    finished = 0
+    
+    def handle(message: Tuple[Any, ...]):
+        nonlocal finished
+        if message[0] == 'done':
+            finished += 1
+            for key in cache_stats:
+                cache_stats[key] += message[1].get('cache_stats', {}).get(key, 0)
+            if message[1].get('metrics'):
+                metrics.merge(message[1]['metrics'])
+            return
+        _, username, found, total_platforms, lines = message
+        totals['targets'] += 1
+        totals['checks'] += total_platforms
+        totals['found'] += found
+        logging.info("%s✓ %s: %d/%d found%s", Colors.GREEN, username, found, total_platforms, Colors.END)
+        if sink and lines:
+            sink.write_encoded(*lines)
+    
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    threading.Thread(target=feed, name="reaper-shard-feed", daemon=True).start()
+    
+    try:
+        while finished < len(workers):
+            try:
+                handle(await loop.run_in_executor(None, partial(results.get, timeout=1.0)))
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    # A worker killed outright never reports; take what is left.
+                    while True:
+                        try:
+                            handle(results.get(timeout=0.1))
+                        except queue.Empty:
+                            break
+                    break
+    finally:
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        if args.metrics:
+            metrics.write(args.metrics)
+            logging.info(f"{Colors.GREEN}📈 Metrics written to: {args.metrics}{Colors.END}")
+        if sink:
+            sink.close()
+            logging.info(f"{Colors.GREEN}📁 Results streamed to: {sink.path}{Colors.END}")
+            if finished < len(workers):
+                logging.info(f"{Colors.YELLOW}Scan interrupted; continue it with --resume {sink.path}{Colors.END}")
+    
+    crashed = len(workers) - finished
+    if crashed:
+        logging.error(f"{crashed} worker process(es) exited without finishing their targets")
+    
+    elapsed = time.perf_counter() - started
+    summary = {
+        **totals,
+        'workers': len(workers),
+        'elapsed_seconds': elapsed,
+        'checks_per_second': totals['checks'] / elapsed if elapsed > 0 else 0.0
+    }
+    lookups = cache_stats['hits'] + cache_stats['misses']
+    print_bulk_summary(summary, {
+        **cache_stats,
+        'hit_rate': (cache_stats['hits'] / lookups) * 100 if lookups else 0
+    } if args.result_cache else None)
+
+def run_brain_scan(args: argparse.Namespace):
+    """Profile usernames without any network checks, streamed as NDJSON 'brain' records.
+
+    With --no-save the records go to stdout so they can be piped elsewhere.
+    """
+    targets = read_targets(args.input) if args.input else [args.username]
+    if args.no_save:
+        for record in brain_analyze_batch(targets):
+            sys.stdout.write(ResultSink.encode('brain', record))
+        sys.stdout.flush()
+        return
+    
+    display_banner()
+    levels = defaultdict(int)
+    started = time.perf_counter()
+    sink = ResultSink(stream_path(args, "brain"), flush_interval=args.flush_interval)
+    try:
+        for record in brain_analyze_batch(targets):
+            levels[record['risk_assessment']['level']] += 1
+            sink.write('brain', record)
+    finally:
+        sink.close()
+    elapsed = time.perf_counter() - started
+    total = sum(levels.values())
+    
+    logging.info(f"{Colors.GREEN}📁 Results streamed to: {sink.path}{Colors.END}")
+    print(f"\n{Colors.BOLD}{Colors.PINK}🔥 HANDY REAPER - BRAIN ANALYSIS{Colors.END}")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+    print(f"  Usernames Profiled: {total}")
+    print(f"  Risk High/Medium/Low: {Colors.RED}{levels['high']}{Colors.END}/{Colors.YELLOW}{levels['medium']}{Colors.END}/{Colors.GREEN}{levels['low']}{Colors.END}")
+    print(f"  Throughput: {Colors.CYAN}{total / elapsed if elapsed > 0 else 0.0:.0f} usernames/s{Colors.END}")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+
+TIME_UNITS = {'m': 60, 'h': 3600, 'd': 86400, 'w': 7 * 86400}
+
+def parse_when(spec: str) -> float:
+    """'30d', '12h', '2w', '90m' ago, or an ISO date/time, as a Unix timestamp."""
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([mhdw])', spec.strip())
+    if match:
+        return time.time() - float(match.group(1)) * TIME_UNITS[match.group(2)]
+    return datetime.fromisoformat(spec.strip()).timestamp()
+
+def format_when(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+
+def run_history(args: argparse.Namespace):
+    """--import-reports, --query and --diff against the --history store; no network access."""
+    store = FindingsStore(args.history)
+    try:
+        if args.import_reports:
+            started = time.perf_counter()
+            counts = store.import_reports(args.import_reports)
+            logging.info(
+                f"{Colors.GREEN}📥 Imported {counts['imported']} report(s) into {args.history} "
+                f"({counts['skipped']} already stored, {counts['unreadable']} unreadable) "
+                f"in {time.perf_counter() - started:.1f}s{Colors.END}"
+            )
+        
+        if args.query:
+            started = time.perf_counter()
+            rows = store.query(
+                username=args.username,
+                platform=args.on,
+                status=None if args.status == 'any' else args.status,
+                since=parse_when(args.since) if args.since else None,
+                until=parse_when(args.until) if args.until else None,
+                limit=args.limit
+            )
+            elapsed = time.perf_counter() - started
+            
+            print(f"\n{Colors.BOLD}{Colors.PINK}🔥 HANDY REAPER - FINDINGS{Colors.END}")
+            print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+            for row in rows:
+                color = Colors.GREEN if row['status'] == 'found' else Colors.YELLOW
+                print(f"  {format_when(row['scanned_at'])}  {row['username']:<20} {row['platform']:<14} "
+                      f"{color}{row['status']:<10}{Colors.END} {row['url'] or ''}")
+            print(f"  {len(rows)} result(s) in {elapsed * 1000:.1f} ms")
+            print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+        
+        if args.diff:
+            started = time.perf_counter()
+            changes = store.diff(args.diff, since=parse_when(args.since) if args.since else None)
+            elapsed = time.perf_counter() - started
+            
+            print(f"\n{Colors.BOLD}{Colors.PINK}🔥 HANDY REAPER - CHANGES FOR {args.diff}{Colors.END}")
+            print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+            if changes is None:
+                print(f"  {Colors.YELLOW}Fewer than two stored runs to compare{Colors.END}")
+            else:
+                print(f"  {format_when(changes['old_scanned_at'])} → {format_when(changes['new_scanned_at'])}")
+                for platform, url in changes['appeared'].items():
+                    print(f"  {Colors.GREEN}+ {platform:<14}{Colors.END} {url or ''}")
+                for platform, status in changes['disappeared'].items():
+                    print(f"  {Colors.RED}- {platform:<14}{Colors.END} now {status or 'not checked'}")
+                for platform, change in changes['changed'].items():
+                    print(f"  {Colors.YELLOW}~ {platform:<14}{Colors.END} {change['was'] or 'not checked'} → {change['now'] or 'not checked'}")
+                print(f"  {changes['unchanged']} platform(s) unchanged; compared in {elapsed * 1000:.1f} ms")
+            print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+    finally:
+        store.close()
+
+async def run_domain_scan(dns_analyzer: DNSAnalyzer, args: argparse.Namespace):
+    display_banner()
+    logging.info(f"{Colors.CYAN}🌐 DNS analysis of domains from {args.domains}{Colors.END}")
+    
+    summary = {
+        'domains': 0,
+        'errors': 0,
+        'spf_configured': 0,
+        'dmarc_configured': 0,
+        'dkim_hints': 0
+    }
+    sink = None if args.no_save else ResultSink(stream_path(args, "dns"), flush_interval=args.flush_interval)
+    
+    started = time.perf_counter()
+    try:
+        async for result in dns_analyzer.analyze_domains(read_targets(args.domains), args.dns_concurrency):
+            summary['domains'] += 1
+            if 'error' in result:
+                summary['errors'] += 1
+            security = result.get('security', {})
+            for check in ('spf_configured', 'dmarc_configured', 'dkim_hints'):
+                if security.get(check):
+                    summary[check] += 1
+            if sink:
+                sink.write('dns', result)
+    finally:
+        if sink:
+            sink.close()
+        dns_analyzer.cache.save()
+    
+    elapsed = time.perf_counter() - started
+    summary['elapsed_seconds'] = elapsed
+    summary['domains_per_second'] = summary['domains'] / elapsed if elapsed > 0 else 0.0
+    summary['dns_cache'] = dns_analyzer.cache.stats()
+    summary['timestamp'] = datetime.now().isoformat()
+    
+    if sink:
+        summary_path = sink.path.split('.ndjson')[0] + '_summary.json'
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        logging.info(f"{Colors.GREEN}📁 Results saved to: {sink.path}{Colors.END}")
+    
+    total = summary['domains'] or 1
+    print(f"\n{Colors.BOLD}{Colors.PINK}🔥 HANDY REAPER - DNS INTELLIGENCE{Colors.END}")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+    print(f"  Domains Analyzed: {summary['domains']}")
+    print(f"  SPF Configured: {summary['spf_configured']} ({summary['spf_configured'] / total * 100:.1f}%)")
+    print(f"  DMARC Configured: {summary['dmarc_configured']} ({summary['dmarc_configured'] / total * 100:.1f}%)")
+    print(f"  Errors: {summary['errors']}")
+    print(f"  Throughput: {Colors.CYAN}{summary['domains_per_second']:.1f} domains/s{Colors.END}")
+    print(f"  DNS Cache Hit Rate: {summary['dns_cache']['hit_rate']:.1f}%")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+
+@dataclass
+class DaemonScan:
+    """One username scan run by the daemon, shared by every client that asked for it."""
+    id: str
+    username: str
+    state: str = 'running'
+    tokens: Set[str] = None
+    checks: int = 0
+    found: int = 0
+    brain: Optional[Dict[str, Any]] = None
+    statistics: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created: float = 0.0
+    finished: Optional[float] = None
+    lines: List[str] = None
+    listeners: List[asyncio.Queue] = None
+    task: Optional[asyncio.Task] = None
+    
+    def __post_init__(self):
+        self.lines = self.lines or []
+        self.listeners = self.listeners or []
+        self.tokens = self.tokens or set()
+        self.created = self.created or time.time()
+    
+    def publish(self, line: Optional[str]):
+        """Record a stream line (None ends the stream) and pass it to live listeners."""
+        if line is not None:
+            self.lines.append(line)
+        for listener in self.listeners:
+            listener.put_nowait(line)
+    
+    def status(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'username': self.username,
+            'state': self.state,
+            'subscribers': len(self.tokens),
+            'checks_completed': self.checks,
+            'found': self.found,
+            'brain': self.brain,
+            'statistics': self.statistics,
+            'error': self.error,
+            'created': datetime.fromtimestamp(self.created).isoformat(),
+            'finished': datetime.fromtimestamp(self.finished).isoformat() if self.finished else None
+        }
+
+class ScanService:
+    """Long-running scan API over one warm EnhancedOSINTSystem.
+
+    Sessions, connection pools, rate limiter and controller state, and the
+    DNS and result caches live as long as the daemon. Requests for a
+    username already being scanned join that scan instead of starting
+    another. Each submit gets its own subscription token, and the scan is
+    only cancelled once every token has been cancelled; cancelling the same
+    token again is a no-op. Finished scans are kept for ``retain`` seconds.
+
+        POST   /scans                     {"username": "..."}  -> scan status and token
+        GET    /scans                     all known scans
+        GET    /scans/{id}                scan status
+        GET    /scans/{id}/results        NDJSON stream of brain/check/scan_complete records
+        DELETE /scans/{id}?token=TOKEN    cancel this subscription
+        GET    /metrics             Prometheus text (``?format=json`` for JSON)
+    """
+
+    def __init__(self, osint_system: EnhancedOSINTSystem, retain: float = 900.0, max_finished: int = 1000):
+        self.osint_system = osint_system
+        self.retain = retain
+        self.max_finished = max_finished
+        self.scans: Dict[str, DaemonScan] = {}
+        self.running: Dict[str, DaemonScan] = {}
+        self.finished = OrderedDict()
+    
+    def app(self) -> 'web.Application':
+        from aiohttp import web
+        
+        app = web.Application()
+        app.router.add_post('/scans', self.submit)
+        app.router.add_get('/scans', self.list_scans)
+        app.router.add_get('/scans/{id}', self.status)
+        app.router.add_get('/scans/{id}/results', self.stream_results)
+        app.router.add_delete('/scans/{id}', self.cancel)
+        app.router.add_get('/health', self.health)
+        app.router.add_get('/metrics', self.metrics)
+        return app
+    
+    def _prune(self):
+        cutoff = time.time() - self.retain
+        while self.finished:
+            scan_id, finished = next(iter(self.finished.items()))
+            if finished >= cutoff and len(self.finished) <= self.max_finished:
+                break
+            del self.finished[scan_id]
+            self.scans.pop(scan_id, None)
+    
+    def _lookup(self, request: 'web.Request') -> DaemonScan:
+        from aiohttp import web
+        scan = self.scans.get(request.match_info['id'])
+        if scan is None:
+            raise web.HTTPNotFound(text=json.dumps({'error': 'unknown scan id'}), content_type='application/json')
+        return scan
+    
+    def start(self, username: str) -> Tuple[DaemonScan, str, bool]:
+        """Start a scan of ``username``, or join the one already running.
+
+        Returns (scan, subscription token, joined).
+        """
+        token = uuid.uuid4().hex
+        scan = self.running.get(username)
+        if scan:
+            scan.tokens.add(token)
+            return scan, token, True
+        
+        self._prune()
+        scan = DaemonScan(id=uuid.uuid4().hex[:16], username=username, tokens={token})
+        self.scans[scan.id] = scan
+        self.running[username] = scan
+        scan.task = asyncio.ensure_future(self._run(scan))
+        return scan, token, False
+    
+    async def _run(self, scan: DaemonScan):
+        def on_result(platform: str, result: Dict[str, Any]):
+            scan.checks += 1
+            if result.get('status') == 'found':
+                scan.found += 1
+            scan.publish(ResultSink.encode('check', {'username': scan.username, **result}))
+        
+        try:
+            scan.brain = await self.osint_system.brain_analyze(scan.username)
+            scan.publish(ResultSink.encode('brain', scan.brain))
+            muscle = await self.osint_system.muscle_scan(scan.username, on_result=on_result)
+            scan.statistics = muscle['statistics']
+            scan.state = 'done'
+        except asyncio.CancelledError:
+            scan.state = 'cancelled'
+        except Exception as error:
+            logging.error("Daemon scan of %s failed: %s", scan.username, error)
+            scan.state = 'failed'
+            scan.error = str(error)
+        finally:
+            scan.finished = time.time()
+            if self.running.get(scan.username) is scan:
+                del self.running[scan.username]
+            self.finished[scan.id] = scan.finished
+            scan.publish(ResultSink.encode('scan_complete', {
+                'username': scan.username,
+                'state': scan.state,
+                'total_platforms': len(self.osint_system.platforms),
+                'timestamp': datetime.now().isoformat()
+            }))
+            scan.publish(None)
+            # Flushing waits on the writer threads, so keep it off the event loop.
+            loop = asyncio.get_running_loop()
+            if self.osint_system.result_cache:
+                await loop.run_in_executor(None, self.osint_system.result_cache.flush)
+            if self.osint_system.history:
+                await loop.run_in_executor(None, self.osint_system.history.flush)
+    
+    async def submit(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+        try:
+            payload = await request.json()
+        except ValueError:
+            payload = None
+        username = payload.get('username') if isinstance(payload, dict) else None
+        if not isinstance(username, str) or not username.strip():
+            return web.json_response({'error': 'expected {"username": "..."}'}, status=400)
+        
+        scan, token, joined = self.start(username.strip())
+        return web.json_response({**scan.status(), 'token': token, 'joined': joined}, status=202)
+    
+    async def list_scans(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+        return web.json_response([
+            {'id': scan.id, 'username': scan.username, 'state': scan.state}
+            for scan in self.scans.values()
+        ])
+    
+    async def status(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+        return web.json_response(self._lookup(request).status())
+    
+    async def stream_results(self, request: 'web.Request') -> 'web.StreamResponse':
+        from aiohttp import web
+        scan = self._lookup(request)
+        response = web.StreamResponse(headers={'Content-Type': 'application/x-ndjson'})
+        await response.prepare(request)
+        
+        # Snapshot and subscribe in one step so no line is missed or repeated.
+        backlog = list(scan.lines)
+        listener = None
+        if scan.finished is None:
+            listener = asyncio.Queue()
+            scan.listeners.append(listener)
+        try:
+            if backlog:
+                await response.write(''.join(backlog).encode('utf-8'))
+            while listener:
+                line = await listener.get()
+                if line is None:
+                    break
+                await response.write(line.encode('utf-8'))
+            await response.write_eof()
+        finally:
+            if listener:
+                scan.listeners.remove(listener)
+        return response
+    
+    async def cancel(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+        scan = self._lookup(request)
+        token = request.query.get('token')
+        if not token:
+            return web.json_response({'error': 'expected ?token= from the submit response'}, status=400)
+        if scan.finished is None and token in scan.tokens:
+            scan.tokens.discard(token)
+            if not scan.tokens:
+                scan.task.cancel()
+                await asyncio.wait({scan.task})
+        return web.json_response(scan.status())
+    
+    async def health(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+        result_cache = self.osint_system.result_cache
+        return web.json_response({
+            'running': len(self.running),
+            'retained': len(self.scans),
+            'platforms': len(self.osint_system.platforms),
+            'result_cache': result_cache.stats() if result_cache else None,
+            'dns_cache': self.osint_system.dns_analyzer.cache.stats()
+        })
+    
+    async def metrics(self, request: 'web.Request') -> 'web.Response':
+        from aiohttp import web
+        metrics = self.osint_system.collect_metrics()
+        if request.query.get('format') == 'json':
+            return web.json_response(metrics.to_dict())
+        return web.Response(text=metrics.to_prometheus(), content_type='text/plain')
+    
+    async def close(self):
+        tasks = [scan.task for scan in self.running.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+def parse_listen(spec: str) -> Tuple[str, int]:
+    """'HOST:PORT' or 'PORT' (bound to localhost)."""
+    host, _, port = spec.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+async def run_daemon(osint_system: EnhancedOSINTSystem, args: argparse.Namespace):
+    from aiohttp import web
+    
+    display_banner()
+    host, port = parse_listen(args.listen)
+    service = ScanService(osint_system)
+    await osint_system.initialize()
+    
+    runner = web.AppRunner(service.app(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logging.info(f"{Colors.CYAN}🛰️  Daemon listening on http://{host}:{port}{Colors.END}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+        await runner.cleanup()
+        await osint_system.close()
+        osint_system.dns_analyzer.cache.save()
+
+def start_profiling(metrics: ScanMetrics) -> Any:
+    """Profile the rest of the run with cProfile and time every asyncio task by coroutine."""
+    import cProfile
+    
+    loop = asyncio.get_running_loop()
+    
+    def timed_task(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs) -> asyncio.Task:
+        task = asyncio.Task(coro, loop=loop, **kwargs)
+        name = getattr(coro, '__qualname__', type(coro).__name__)
+        created = loop.time()
+        task.add_done_callback(lambda _: metrics.observe('task_seconds', loop.time() - created, coroutine=name))
+        return task
+    
+    loop.set_task_factory(timed_task)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+def finish_profiling(profiler: Any, path: str, metrics: ScanMetrics):
+    import pstats
+    
+    profiler.disable()
+    asyncio.get_running_loop().set_task_factory(None)
+    profiler.dump_stats(path)
+    
+    print(f"\n{Colors.BOLD}{Colors.PINK}🔥 HANDY REAPER - PROFILE{Colors.END}")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+    pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(20)
+    
+    tasks = sorted(
+        ((dict(labels)['coroutine'], histogram) for (name, labels), histogram in metrics.histograms.items() if name == 'task_seconds'),
+        key=lambda item: item[1].sum,
+        reverse=True
+    )
+    print(f"{Colors.BOLD}asyncio tasks by total wall time:{Colors.END}")
+    for coroutine, histogram in tasks[:15]:
+        print(f"  {coroutine:<55} n={histogram.count:<7} total={histogram.sum:8.2f}s  mean={histogram.sum / histogram.count * 1000:8.1f}ms")
+    print(f"{Colors.CYAN}{'='*50}{Colors.END}")
+    logging.info(f"{Colors.GREEN}📈 Profile written to: {path} (inspect with python -m pstats){Colors.END}")
+
+def build_rate_limiter(args: argparse.Namespace, arrivals: Any = None) -> RateLimiter:
+    """Rate limiter from the CLI flags; shared across processes when given an arrivals table.
+
+    Raises OSError, ValueError or KeyError for unreadable or malformed limits.
+    """
+    default_limit = RateLimitConfig.parse(args.rate_limit)
+    platform_limits = {}
+    if args.rate_config:
+        file_default, platform_limits = load_rate_limits(args.rate_config)
+        default_limit = file_default or default_limit
+    for entry in args.platform_rate:
+        platform, _, spec = entry.partition('=')
+        platform_limits[platform] = RateLimitConfig.parse(spec)
+    
+    limiter_args = {
+        'max_requests': default_limit.max_requests,
+        'time_window': default_limit.time_window,
+        'burst': default_limit.burst,
+        'platform_limits': platform_limits
+    }
+    if arrivals is not None:
+        return SharedRateLimiter(arrivals, **limiter_args)
+    return RateLimiter(**limiter_args)
+
+def build_proxy_config(args: argparse.Namespace) -> ProxyConfig:
+    proxy_config = ProxyConfig()
+    if args.proxy:
+        proxy_config.enabled = True
+        proxy_config.http_proxy = args.proxy
+    if args.proxy_list:
+        proxy_config.proxy_list = list(read_targets(args.proxy_list))
+        proxy_config.enabled = True
+        proxy_config.rotation_enabled = True
+    return proxy_config
+
+def build_osint_system(
+    args: argparse.Namespace,
+    rate_limiter: RateLimiter,
+    proxy_config: ProxyConfig,
+    platform_rules: Optional[Dict[str, PlatformRule]] = None
+) -> EnhancedOSINTSystem:
+    # Each proxy is a separate client to the target sites, so per-host
+    # concurrency may grow with the size of the pool.
+    proxy_scale = max(1, len(proxy_config.proxy_list)) if proxy_config.rotation_enabled else 1
+    metrics = ScanMetrics()
+    
+    osint_system = EnhancedOSINTSystem(
+        proxy_config=proxy_config,
+        max_concurrency=args.concurrency,
+        per_host_limit=args.per_host,
+        rate_limiter=rate_limiter,
+        concurrency=AdaptiveConcurrency(
+            initial=args.per_host,
+            min_limit=args.per_host if args.no_adaptive else 1,
+            max_limit=args.per_host if args.no_adaptive else args.per_host_max * proxy_scale
+        ),
+        retry_budget=RetryBudget(ratio=args.retry_budget),
+        dns_analyzer=DNSAnalyzer(cache=DNSCache(path=args.dns_cache), metrics=metrics),
+        result_cache=ResultCache(args.result_cache, max_age=args.max_age) if args.result_cache else None,
+        history=FindingsStore(args.history) if args.history else None,
+        deadline=args.deadline,
+        hedge=args.hedge,
+        platform_rules=platform_rules,
+        metrics=metrics
+    )
+    osint_system.proxy_check_url = args.proxy_check_url
+    return osint_system
+
 async def main():
     parser = argparse.ArgumentParser(description="🔥 HANDY REAPER - OSINT Intelligence System")
-    parser.add_argument("username", help="Target username to investigate")
+    parser.add_argument("username", nargs="?", help="Target username to investigate")
+    parser.add_argument("--input", help="File with one username per line for bulk mode ('-' for stdin)")
+    parser.add_argument("--domains", help="File with one domain per line for DNS analysis ('-' for stdin)")
     parser.add_argument("--proxy", help="HTTP proxy to use")
+    parser.add_argument("--proxy-list", help="File with one proxy URL per line; health-checked and weighted by performance")
+    parser.add_argument("--proxy-check-url", default="https://www.gstatic.com/generate_204",
+                        help="URL fetched through each proxy to health-check it")
+    parser.add_argument("--brain-only", action="store_true",
+                        help="Only profile the username(s), streaming NDJSON brain records (to stdout with --no-save)")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Write scan metrics at the end of the run: JSON for *.json, Prometheus text otherwise")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Profile the run with cProfile (stats saved to FILE) and time asyncio tasks; parent process only with --workers")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run as a daemon with an HTTP/JSON scan API, keeping sessions and caches warm")
+    parser.add_argument("--listen", default="127.0.0.1:8642", metavar="[HOST:]PORT", help="Address for --serve")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Shard --input targets across this many processes; --concurrency and --per-host apply to each")
+    parser.add_argument("--platforms", help="JSON platform registry (default: platforms.json next to this script)")
     parser.add_argument("--output-dir", default="reports", help="Output directory")
     parser.add_argument("--no-save", action="store_true", help="Don't save results")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the NDJSON result stream")
+    parser.add_argument("--flush-interval", type=float, default=1.0,
+                        help="Seconds between result stream flushes to disk (the bulk scan checkpoint interval)")
+    parser.add_argument("--resume", metavar="STREAM",
+                        help="Continue an interrupted --input scan, appending to its result stream and skipping checks it holds")
+    parser.add_argument("--build-report", metavar="STREAM", help="Build JSON reports from a saved result stream and exit")
+    parser.add_argument("--concurrency", type=int, default=10, help="Maximum requests in flight")
+    parser.add_argument("--per-host", type=int, default=2, help="Starting requests in flight per host")
+    parser.add_argument("--per-host-max", type=int, default=16, help="Ceiling for adaptive per-host concurrency")
+    parser.add_argument("--retry-budget", type=float, default=0.2,
+                        help="Retries allowed as a fraction of first attempts")
+    parser.add_argument("--deadline", type=float, help="Per-target time budget in seconds; unfinished checks are reported as deadline_exceeded")
+    parser.add_argument("--hedge", action="store_true", help="Send a second request when a check outlives its platform's p95 latency (pooled across platforms until it has enough samples)")
+    parser.add_argument("--no-adaptive", action="store_true", help="Pin per-host concurrency at --per-host")
+    parser.add_argument("--rate-limit", default="10/60", help="Default rate per host as REQUESTS/SECONDS[:BURST]")
+    parser.add_argument("--platform-rate", action="append", default=[], metavar="PLATFORM=REQUESTS/SECONDS[:BURST]",
+                        help="Per-platform rate limit (repeatable)")
+    parser.add_argument("--rate-config", help="JSON file with default and per-platform rate limits")
+    parser.add_argument("--result-cache", help="SQLite file caching platform check results between runs")
+    parser.add_argument("--max-age", type=float, help="Re-check cached results older than this many seconds")
+    parser.add_argument("--dns-concurrency", type=int, default=50, help="Maximum domains analyzed at once")
+    parser.add_argument("--dns-cache", help="JSON file to persist the DNS answer cache between runs")
+    parser.add_argument("--history", metavar="DB", help="SQLite store of every finished scan, searchable with --query and --diff")
+    parser.add_argument("--import-reports", nargs="+", metavar="PATH",
+                        help="Load saved osint_*.json reports (files or directories) into --history")
+    parser.add_argument("--query", action="store_true",
+                        help="Search --history; filter with the username, --on, --status, --since, --until")
+    parser.add_argument("--on", metavar="PLATFORM", help="Platform to search with --query")
+    parser.add_argument("--status", default="found", help="Check status to search with --query ('any' for all)")
+    parser.add_argument("--since", metavar="WHEN", help="Start of the --query window, or --diff baseline: 30d, 12h, 2w or an ISO date")
+    parser.add_argument("--until", metavar="WHEN", help="End of the --query window")
+    parser.add_argument("--limit", type=int, help="Maximum --query results")
+    parser.add_argument("--diff", metavar="USERNAME", help="Show what changed between the last two stored runs of USERNAME")
+    parser.add_argument("--log-level", default="INFO", type=str.upper,
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR", "OFF"], help="Logging threshold; OFF disables logging")
+    parser.add_argument("--log-file", default="osint_reaper.log", help="Log file ('' to log to the console only)")
     
     args = parser.parse_args()
+    configure_logging(args.log_level, args.log_file)
+    if args.build_report:
+        for filename in build_reports(args.build_report, args.output_dir):
+            print(f"{Colors.GREEN}📄 Report: {filename}{Colors.END}")
+        return
     
-    proxy_config = ProxyConfig()
-    if args.proxy:
-        proxy_config.enabled = True
-        proxy_config.http_proxy = args.proxy
+    if args.import_reports or args.query or args.diff:
+        if not args.history:
+            parser.error("--import-reports, --query and --diff require --history")
+        for flag in ('since', 'until'):
+            try:
+                if getattr(args, flag):
+                    parse_when(getattr(args, flag))
+            except ValueError:
+                parser.error(f"invalid --{flag}: {getattr(args, flag)}")
+        run_history(args)
+        return
+    
+    if not args.username and not args.input and not args.domains and not args.serve:
+        parser.error("a username, --input, --domains, --serve or --build-report is required")
+    if args.serve:
+        try:
+            parse_listen(args.listen)
+        except ValueError:
+            parser.error(f"invalid --listen address: {args.listen}")
+    
+    if args.brain_only:
+        if not args.username and not args.input:
+            parser.error("--brain-only requires a username or --input")
+        run_brain_scan(args)
+        return
+    
+    if args.max_age is not None and not args.result_cache:
+        parser.error("--max-age requires --result-cache")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not args.input:
+        parser.error("--workers requires --input")
+    if args.resume and not args.input:
+        parser.error("--resume requires --input")
+    if args.resume and not os.path.exists(args.resume):
+        parser.error(f"cannot resume: {args.resume} does not exist")
+    
+    try:
+        rate_limiter = build_rate_limiter(args)
+    except (OSError, ValueError, KeyError) as error:
+        parser.error(f"invalid rate limit configuration: {error}")
+    
+    try:
+        proxy_config = build_proxy_config(args)
+    except OSError as error:
+        parser.error(f"cannot read proxy list: {error}")
     
-    osint_system = EnhancedOSINTSystem(proxy_config=proxy_config)
+    try:
+        platform_rules = load_platforms(args.platforms)
+    except (OSError, ValueError) as error:
+        parser.error(f"invalid platform registry: {error}")
+    
+    if args.workers > 1:
+        # Only this process is profiled; its time goes to feeding and merging the shards
+        task_metrics = ScanMetrics()
+        profiler = start_profiling(task_metrics) if args.profile else None
+        try:
+            await run_sharded_scan(args, proxy_config, platform_rules)
+        finally:
+            if profiler:
+                finish_profiling(profiler, args.profile, task_metrics)
+        return
+    
+    osint_system = build_osint_system(args, rate_limiter, proxy_config, platform_rules)
+    profiler = start_profiling(osint_system.metrics) if args.profile else None
     
     try:
-        results = await osint_system.full_osint_scan(args.username)
+        if args.serve:
+            await run_daemon(osint_system, args)
+            return
+        
+        if args.domains:
+            await run_domain_scan(osint_system.dns_analyzer, args)
+            return
+        
+        if args.input:
+            await run_bulk_scan(osint_system, args)
+            return
+        
+        sink = None if args.no_save else ResultSink(
+            stream_path(args, f"osint_{args.username}"),
+            flush_interval=args.flush_interval
+        )
+        try:
+            results = await osint_system.full_osint_scan(args.username, sink=sink)
+        finally:
+            if sink:
+                sink.close()
         osint_system.print_summary(results)
         
-        if not args.no_save:
-            filename = osint_system.save_results(results, args.username, args.output_dir)
-            print(f"{Colors.GREEN}📄 Full report: {filename}{Colors.END}")
+        if sink and 'error' not in results:
+            for filename in build_reports(sink.path, args.output_dir):
+                print(f"{Colors.GREEN}📄 Full report: {filename}{Colors.END}")
         
     except KeyboardInterrupt:
         logging.info("Scan interrupted by user")
     except Exception as error:
         logging.error(f"Unexpected error: {error}")
+    finally:
+        if profiler:
+            finish_profiling(profiler, args.profile, osint_system.metrics)
+        if args.metrics:
+            osint_system.collect_metrics().write(args.metrics)
+            logging.info(f"{Colors.GREEN}📈 Metrics written to: {args.metrics}{Colors.END}")
+        if osint_system.result_cache:
+            osint_system.result_cache.close()
+        if osint_system.history:
+            osint_system.history.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,70 @@
+from main import brain_analyze_batch
+
+NAMES = [
+    'alice', 'Admin_01', '12345678', 'a.b-c_d!!', 'ab', 'TestUser',
+    'user٣٤٥', '１２３abc', 'x²³', 'ÉLODIE', 'Straße', 'ǅemal', '',
+]
+
+
+def reference(username):
+    """Per-name analysis as brain_analyze did it before the batch version."""
+    features = {
+        'length': len(username),
+        'has_digits': any(c.isdigit() for c in username),
+        'has_underscore': '_' in username,
+        'has_dot': '.' in username,
+        'has_dash': '-' in username,
+        'alphanumeric_ratio': sum(c.isalnum() for c in username) / len(username) if username else 0,
+        'special_chars': len([c for c in username if not c.isalnum()]),
+        'uppercase_count': sum(c.isupper() for c in username),
+        'digit_count': sum(c.isdigit() for c in username),
+    }
+
+    patterns = []
+    if any(x in username.lower() for x in ['admin', 'test', 'user', 'demo']):
+        patterns.append("generic")
+    if len(username) < 4:
+        patterns.append("short")
+    if features['digit_count'] > len(username) / 2:
+        patterns.append("numeric_heavy")
+    if username.lower() == username and '_' not in username:
+        patterns.append("simple_lowercase")
+
+    pattern_type = patterns[0] if patterns else "custom"
+
+    risk_factors = {
+        'common_pattern': pattern_type == "generic",
+        'short_username': len(username) < 5,
+        'suspicious_chars': features['special_chars'] > 3,
+        'numeric_heavy': features['digit_count'] > len(username) / 2
+    }
+
+    risk_score = sum(risk_factors.values()) / len(risk_factors)
+
+    return {
+        'username': username,
+        'pattern_type': pattern_type,
+        'patterns_detected': patterns,
+        'features': features,
+        'risk_assessment': {
+            'score': risk_score,
+            'factors': risk_factors,
+            'level': 'high' if risk_score > 0.6 else 'medium' if risk_score > 0.3 else 'low'
+        },
+    }
+
+
+def test_batch_matches_per_name_analysis():
+    records = list(brain_analyze_batch(NAMES, chunk_size=4))
+    assert [record['username'] for record in records] == NAMES
+    for record in records:
+        record.pop('confidence')
+        record.pop('timestamp')
+        assert record == reference(record['username'])
+
+
+def test_confidence_is_deterministic_and_in_range():
+    first = [record['confidence'] for record in brain_analyze_batch(NAMES)]
+    second = [record['confidence'] for record in brain_analyze_batch(reversed(NAMES), chunk_size=3)]
+    assert first == second[::-1]
+    assert all(0.75 <= confidence <= 0.98 for confidence in first)
@@ -0,0 +1,81 @@
+import asyncio
+
+from main import EnhancedOSINTSystem, ResultSink, load_platforms, recover_stream
+
+DELAYS = {'alice': 0, 'bob': 0, 'fast': 0, 'slow': 5}
+
+
+def system(**kwargs):
+    rules = {name: rule for name, rule in load_platforms().items() if name in ('github', 'twitter')}
+    osint_system = EnhancedOSINTSystem(platform_rules=rules, **kwargs)
+
+    async def check_platform(platform, url, username, attempt=0):
+        await asyncio.sleep(DELAYS[username])
+        return {'status': 'found', 'url': url, 'platform': platform}
+
+    osint_system.check_platform = check_platform
+    return osint_system
+
+
+def scan(osint_system, usernames):
+    completed = []
+
+    async def run():
+        try:
+            summary = await osint_system.bulk_scan(usernames, on_complete=completed.append)
+        finally:
+            await osint_system.close()
+        return summary
+
+    return asyncio.run(run()), {scan['username']: scan for scan in completed}
+
+
+def test_bulk_scan_reports_every_target():
+    summary, completed = scan(system(), ['alice', 'bob'])
+    assert summary['targets'] == 2
+    assert summary['checks'] == 4
+    assert all(scan['statistics']['found'] == 2 for scan in completed.values())
+
+
+def test_bulk_scan_honours_deadline():
+    summary, completed = scan(system(deadline=0.2), ['slow', 'fast'])
+    assert summary['elapsed_seconds'] < 2
+    assert {result['status'] for result in completed['slow']['platform_results'].values()} == {'deadline_exceeded'}
+    assert {result['status'] for result in completed['fast']['platform_results'].values()} == {'found'}
+
+
+def test_resumed_bulk_scan_only_runs_missing_checks(tmp_path):
+    path = tmp_path / 'bulk.ndjson'
+    sink = ResultSink(str(path))
+    for platform in ('github', 'twitter'):
+        sink.write('check', {'username': 'alice', 'platform': platform, 'status': 'found'})
+    sink.write('scan_complete', {'username': 'alice'})
+    sink.write('check', {'username': 'bob', 'platform': 'github', 'status': 'found'})
+    sink.close()
+    done, unfinished = recover_stream(str(path))
+
+    osint_system = system()
+    stub = osint_system.check_platform
+    calls = []
+
+    async def check_platform(platform, url, username, attempt=0):
+        calls.append((username, platform))
+        return await stub(platform, url, username, attempt)
+
+    osint_system.check_platform = check_platform
+    completed = []
+
+    async def run():
+        try:
+            return await osint_system.bulk_scan(
+                [name for name in ('alice', 'bob', 'fast') if name not in done],
+                on_complete=completed.append,
+                resume=unfinished
+            )
+        finally:
+            await osint_system.close()
+
+    summary = asyncio.run(run())
+    assert sorted(calls) == [('bob', 'twitter'), ('fast', 'github'), ('fast', 'twitter')]
+    assert summary['targets'] == 2
+    assert {scan['username']: len(scan['platform_results']) for scan in completed} == {'bob': 2, 'fast': 2}
@@ -0,0 +1,66 @@
+import sqlite3
+from datetime import datetime
+
+from main import FindingsStore
+
+
+def scan(username, timestamp, statuses):
+    return {
+        'username': username,
+        'platform_results': {
+            platform: {'status': status, 'url': f"https://{platform}.example/{username}", 'platform': platform}
+            for platform, status in statuses.items()
+        },
+        'statistics': {'total_platforms': len(statuses)},
+        'timestamp': timestamp
+    }
+
+
+def test_recorded_scan_is_committed_by_flush(tmp_path):
+    store = FindingsStore(str(tmp_path / 'history.db'))
+    store.record_scan(scan('alice', '2026-09-01T10:00:00', {'steam': 'found'}))
+    store.flush()
+    other = sqlite3.connect(str(tmp_path / 'history.db'))
+    assert other.execute("SELECT COUNT(*) FROM findings").fetchone() == (1,)
+    other.close()
+    store.close()
+
+
+def test_duplicate_runs_are_skipped(tmp_path):
+    store = FindingsStore(str(tmp_path / 'history.db'))
+    first = scan('alice', '2026-09-01T10:00:00', {'steam': 'found'})
+    store.record_scan(first)
+    store.record_scan(first)
+    store.flush()
+    assert store.conn.execute("SELECT COUNT(*) FROM runs").fetchone() == (1,)
+    assert store.conn.execute("SELECT COUNT(*) FROM findings").fetchone() == (1,)
+    store.close()
+
+
+def test_query_returns_latest_match_per_platform(tmp_path):
+    store = FindingsStore(str(tmp_path / 'history.db'))
+    store.record_scan(scan('alice', '2026-09-01T10:00:00', {'steam': 'found', 'github': 'not_found'}))
+    store.record_scan(scan('alice', '2026-09-20T10:00:00', {'steam': 'found', 'github': 'found'}))
+    store.record_scan(scan('bob', '2026-08-01T10:00:00', {'steam': 'found'}))
+    store.flush()
+
+    since = datetime(2026, 9, 1).timestamp()
+    rows = store.query(platform='steam', since=since)
+    assert [row['username'] for row in rows] == ['alice']
+    assert rows[0]['scanned_at'] == datetime(2026, 9, 20, 10).timestamp()
+    assert {row['username'] for row in store.query(platform='steam')} == {'alice', 'bob'}
+    store.close()
+
+
+def test_diff_between_last_two_runs(tmp_path):
+    store = FindingsStore(str(tmp_path / 'history.db'))
+    store.record_scan(scan('alice', '2026-09-01T10:00:00', {'steam': 'found', 'github': 'not_found', 'reddit': 'timeout'}))
+    store.record_scan(scan('alice', '2026-09-20T10:00:00', {'steam': 'not_found', 'github': 'found', 'reddit': 'not_found'}))
+    store.flush()
+
+    changes = store.diff('alice')
+    assert changes['appeared'] == {'github': 'https://github.example/alice'}
+    assert changes['disappeared'] == {'steam': 'not_found'}
+    assert changes['changed'] == {'reddit': {'was': 'timeout', 'now': 'not_found'}}
+    assert store.diff('bob') is None
+    store.close()
@@ -0,0 +1,116 @@
+import asyncio
+
+from main import EnhancedOSINTSystem, ProbeResult, ProbeStrategy, RateLimiter
+
+
+def system(latency):
+    osint_system = EnhancedOSINTSystem(hedge=True)
+    probes = []
+
+    async def probe(url, headers, proxy, strategy):
+        task = asyncio.current_task()
+        probes.append(task)
+        await asyncio.sleep(latency(len(probes)))
+        return ProbeResult(status=200, final_url=url)
+
+    osint_system.probe = probe
+    return osint_system, probes
+
+
+def warm(osint_system, platform, latency=0.05, count=20):
+    for _ in range(count):
+        osint_system.probe_latencies.record(platform, latency)
+
+
+def test_cancelled_caller_cancels_primary_probe():
+    osint_system, probes = system(lambda n: 10)
+    warm(osint_system, 'github')
+
+    async def run():
+        try:
+            await asyncio.wait_for(
+                osint_system.hedged_probe('github', 'https://github.com/x', {}, None, ProbeStrategy()),
+                timeout=0.01
+            )
+        except asyncio.TimeoutError:
+            pass
+        await asyncio.sleep(0)
+        return [probe.cancelled() for probe in probes]
+
+    assert asyncio.run(run()) == [True]
+
+
+def test_hedge_wins_when_primary_is_slow():
+    osint_system, probes = system(lambda n: 10 if n == 1 else 0.01)
+    warm(osint_system, 'github')
+
+    async def run():
+        result = await osint_system.hedged_probe('github', 'https://github.com/x', {}, None, ProbeStrategy())
+        await asyncio.sleep(0)
+        return result, probes[0].cancelled()
+
+    result, primary_cancelled = asyncio.run(asyncio.wait_for(run(), timeout=5))
+    assert result.status == 200
+    assert primary_cancelled
+    assert osint_system.hedges_fired == 1
+
+
+def test_hedge_fires_once_other_platforms_provide_a_threshold():
+    osint_system, probes = system(lambda n: 10 if n == 1 else 0.01)
+
+    async def run():
+        probe = asyncio.ensure_future(
+            osint_system.hedged_probe('github', 'https://github.com/x', {}, None, ProbeStrategy())
+        )
+        await asyncio.sleep(0.05)
+        for platform in ('twitter', 'reddit'):
+            warm(osint_system, platform, count=10)
+        return await probe
+
+    result = asyncio.run(asyncio.wait_for(run(), timeout=5))
+    assert result.status == 200
+    assert osint_system.hedges_fired == 1
+
+
+def test_unhedged_probe_runs_directly():
+    osint_system, probes = system(lambda n: 0.01)
+    osint_system.hedge = False
+    asyncio.run(osint_system.hedged_probe('github', 'https://github.com/x', {}, None, ProbeStrategy()))
+    assert osint_system.hedges_fired == 0
+    assert len(probes) == 1
+
+
+def test_hedge_is_skipped_without_a_free_rate_limit_slot():
+    osint_system, probes = system(lambda n: 0.3)
+    osint_system.rate_limiter = RateLimiter(max_requests=1, time_window=60)
+    warm(osint_system, 'github')
+
+    async def run():
+        await osint_system.rate_limiter.acquire('github.com', 'github')
+        return await osint_system.hedged_probe('github', 'https://github.com/x', {}, None, ProbeStrategy())
+
+    result = asyncio.run(asyncio.wait_for(run(), timeout=5))
+    assert result.status == 200
+    assert osint_system.hedges_fired == 0
+    assert len(probes) == 1
+
+
+def test_hedge_result_names_the_proxy_that_answered():
+    osint_system, probes = system(lambda n: 10 if n == 1 else 0.01)
+    osint_system.proxy_config.enabled = True
+    osint_system.get_proxy = lambda: 'http://hedge:8080'
+    warm(osint_system, 'github')
+
+    result = asyncio.run(asyncio.wait_for(
+        osint_system.hedged_probe('github', 'https://github.com/x', {}, 'http://primary:8080', ProbeStrategy()),
+        timeout=5
+    ))
+    assert result.proxy == 'http://hedge:8080'
+
+
+def test_try_acquire_never_overdraws_the_bucket():
+    limiter = RateLimiter(max_requests=2, time_window=60)
+    assert limiter.try_acquire('host')
+    assert limiter.try_acquire('host')
+    assert not limiter.try_acquire('host')
+    assert not limiter.try_acquire('host')
@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+
+import main
+from main import RateLimitConfig
+
+
+def test_parse_reads_requests_window_and_burst():
+    limit = RateLimitConfig.parse('30/60:5')
+    assert (limit.max_requests, limit.time_window, limit.burst) == (30, 60.0, 5)
+    assert limit.interval == 2.0
+
+
+@pytest.mark.parametrize('spec', ['0/60', '10/0', '-1/60', '10/60:0'])
+def test_parse_rejects_non_positive_limits(spec):
+    with pytest.raises(ValueError):
+        RateLimitConfig.parse(spec)
+
+
+def test_from_dict_rejects_zero_requests():
+    with pytest.raises(ValueError):
+        RateLimitConfig.from_dict({'max_requests': 0, 'time_window': 60})
+
+
+@pytest.mark.parametrize('flags', [['--rate-limit', '0/60'], ['--platform-rate', 'github=0/60']])
+def test_cli_reports_invalid_limits(monkeypatch, capsys, flags):
+    monkeypatch.setattr('sys.argv', ['main.py', 'alice', *flags])
+    with pytest.raises(SystemExit) as exit_info:
+        asyncio.run(main.main())
+    assert exit_info.value.code == 2
+    assert 'invalid rate limit configuration' in capsys.readouterr().err
@@ -0,0 +1,59 @@
+import asyncio
+import gzip
+import json
+import random
+
+from main import ResultSink, read_stream, recover_stream
+
+
+def check(username, platform):
+    return ResultSink.encode('check', {'username': username, 'platform': platform, 'status': 'found'})
+
+
+def complete(username):
+    return ResultSink.encode('scan_complete', {'username': username})
+
+
+def test_torn_last_line_is_cut_from_plain_stream(tmp_path):
+    path = tmp_path / 'bulk.ndjson'
+    intact = check('alice', 'github') + complete('alice') + check('bob', 'github')
+    path.write_text(intact + check('bob', 'twitter')[:20], encoding='utf-8')
+
+    completed, unfinished = recover_stream(str(path))
+    assert completed == {'alice'}
+    assert list(unfinished) == ['bob'] and list(unfinished['bob']) == ['github']
+    assert path.read_text(encoding='utf-8') == intact
+
+
+def test_truncated_gzip_member_keeps_records_before_it(tmp_path):
+    path = tmp_path / 'bulk.ndjson.gz'
+    rng = random.Random(0)
+    sink = ResultSink(str(path))
+    for n in range(2000):
+        sink.write('check', {'username': f"user{n}", 'platform': 'github', 'noise': rng.getrandbits(64)})
+    sink.close()
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+    completed, unfinished = recover_stream(str(path))
+    assert not completed
+    assert 0 < len(unfinished) < 2000
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        usernames = [json.loads(line)['username'] for line in f]
+    assert usernames == [f"user{n}" for n in range(len(unfinished))]
+
+
+def test_sink_flushes_on_a_timer_without_further_writes(tmp_path):
+    path = tmp_path / 'bulk.ndjson'
+
+    async def run():
+        sink = ResultSink(str(path), flush_interval=0.05)
+        sink.write('check', {'username': 'alice', 'platform': 'github'})
+        sink.write('check', {'username': 'alice', 'platform': 'twitter'})
+        await asyncio.sleep(0.2)
+        lines = path.read_text(encoding='utf-8').splitlines()
+        sink.close()
+        return lines
+
+    assert len(asyncio.run(run())) == 2
+    assert [record['platform'] for record in read_stream(str(path))] == ['github', 'twitter']
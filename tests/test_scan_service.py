@@ -0,0 +1,41 @@
+import asyncio
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from main import ScanService
+
+
+class SlowSystem:
+    platforms = {'github': 'https://github.com/{}'}
+    result_cache = None
+    history = None
+
+    async def brain_analyze(self, username):
+        return {'username': username}
+
+    async def muscle_scan(self, username, on_result=None):
+        await asyncio.sleep(10)
+        return {'statistics': {}}
+
+
+def test_cancel_is_idempotent_per_subscription_token():
+    async def run():
+        service = ScanService(SlowSystem())
+        async with TestClient(TestServer(service.app())) as client:
+            first = await (await client.post('/scans', json={'username': 'alice'})).json()
+            second = await (await client.post('/scans', json={'username': 'alice'})).json()
+            assert second['joined'] and second['id'] == first['id']
+            assert first['token'] != second['token']
+
+            url = f"/scans/{first['id']}"
+            assert (await client.delete(url)).status == 400
+            for _ in range(3):
+                status = await (await client.delete(url, params={'token': first['token']})).json()
+            assert status['state'] == 'running'
+            assert status['subscribers'] == 1
+
+            status = await (await client.delete(url, params={'token': second['token']})).json()
+            assert status['state'] == 'cancelled'
+            await service.close()
+
+    asyncio.run(asyncio.wait_for(run(), timeout=5))
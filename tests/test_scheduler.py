@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from main import ScanJob, ScanScheduler
+
+
+def job(key, host='example.com', result=None, delay=0.0, error=None):
+    async def factory():
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return key if result is None else result
+    return ScanJob(key=key, host=host, factory=factory)
+
+
+async def collect(scheduler, jobs):
+    return [item async for item in scheduler.map(jobs)]
+
+
+def test_map_yields_every_result():
+    scheduler = ScanScheduler(max_concurrency=4, per_host_limit=2)
+    jobs = [job(i, host=f"host{i % 3}") for i in range(20)]
+    results = asyncio.run(collect(scheduler, jobs))
+    assert sorted(key for key, _ in results) == list(range(20))
+    assert all(key == value for key, value in results)
+
+
+def test_job_exception_is_yielded_as_result():
+    scheduler = ScanScheduler()
+    results = dict(asyncio.run(collect(scheduler, [job('ok'), job('bad', error=ValueError('boom'))])))
+    assert results['ok'] == 'ok'
+    assert isinstance(results['bad'], ValueError)
+
+
+def test_per_host_limit_is_respected():
+    scheduler = ScanScheduler(max_concurrency=10, per_host_limit=2)
+    peak = 0
+
+    def tracked(key):
+        async def factory():
+            nonlocal peak
+            peak = max(peak, scheduler.active['example.com'])
+            await asyncio.sleep(0.01)
+            return key
+        return ScanJob(key=key, host='example.com', factory=factory)
+
+    results = asyncio.run(collect(scheduler, [tracked(i) for i in range(10)]))
+    assert len(results) == 10
+    assert peak == 2
+
+
+@pytest.mark.parametrize('asynchronous', [False, True])
+def test_failing_job_source_raises_instead_of_hanging(asynchronous):
+    def source():
+        yield job('first')
+        raise OSError('cannot read targets')
+
+    async def async_source():
+        for item in source():
+            yield item
+
+    async def run():
+        jobs = async_source() if asynchronous else source()
+        return await asyncio.wait_for(collect(ScanScheduler(), jobs), timeout=5)
+
+    with pytest.raises(OSError, match='cannot read targets'):
+        asyncio.run(run())
+
+
+def test_failing_job_source_before_first_job():
+    def source():
+        raise OSError('missing file')
+        yield
+
+    async def run():
+        return await asyncio.wait_for(collect(ScanScheduler(), source()), timeout=5)
+
+    with pytest.raises(OSError, match='missing file'):
+        asyncio.run(run())
+
+
+def test_concurrent_maps_share_the_global_limit():
+    scheduler = ScanScheduler(max_concurrency=3, per_host_limit=10)
+    in_flight = peak = 0
+
+    def tracked(key):
+        async def factory():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return key
+        return ScanJob(key=key, host=f"host{key % 5}", factory=factory)
+
+    async def run():
+        return await asyncio.gather(*[
+            collect(scheduler, [tracked(scan * 10 + i) for i in range(10)])
+            for scan in range(6)
+        ])
+
+    results = asyncio.run(run())
+    assert sum(len(scan) for scan in results) == 60
+    assert peak == 3